@@ -40,6 +40,12 @@ export default function AuditLogs() {
     limit: 500,
   });
 
+  // The list carries no snapshots; fetch them for the entry being viewed
+  const { data: logDetail } = trpc.audit.getAuditLogDetail.useQuery(
+    { id: selectedLog?.id ?? 0 },
+    { enabled: showSnapshotDialog && !!selectedLog }
+  );
+
   const filteredLogs = auditLogs?.filter(log => {
     const matchesSearch = 
       log.userName.toLowerCase().includes(searchQuery.toLowerCase()) ||
@@ -87,39 +93,30 @@ export default function AuditLogs() {
     toast.success("Audit logs exported successfully");
   };
 
-  const renderSnapshot = (snapshot: string | null) => {
-    if (!snapshot) return <p className="text-muted-foreground">No data</p>;
+  // Snapshots and changes arrive already decoded from their JSON columns
+  const renderSnapshot = (snapshot: unknown) => {
+    if (snapshot == null) return <p className="text-muted-foreground">No data</p>;
     
-    try {
-      const data = JSON.parse(snapshot);
-      return (
-        <pre className="bg-muted p-4 rounded-lg overflow-auto max-h-96 text-sm">
-          {JSON.stringify(data, null, 2)}
-        </pre>
-      );
-    } catch {
-      return <p className="text-destructive">Invalid JSON</p>;
-    }
+    return (
+      <pre className="bg-muted p-4 rounded-lg overflow-auto max-h-96 text-sm">
+        {JSON.stringify(snapshot, null, 2)}
+      </pre>
+    );
   };
 
-  const renderChanges = (changes: string | null) => {
+  const renderChanges = (changes: Record<string, unknown> | null) => {
     if (!changes) return <p className="text-muted-foreground">No changes recorded</p>;
     
-    try {
-      const data = JSON.parse(changes);
-      return (
-        <div className="space-y-2">
-          {Object.entries(data).map(([key, value]) => (
-            <div key={key} className="flex items-start gap-2">
-              <Badge variant="outline">{key}</Badge>
-              <span className="text-sm">{JSON.stringify(value)}</span>
-            </div>
-          ))}
-        </div>
-      );
-    } catch {
-      return <p className="text-destructive">Invalid JSON</p>;
-    }
+    return (
+      <div className="space-y-2">
+        {Object.entries(changes).map(([key, value]) => (
+          <div key={key} className="flex items-start gap-2">
+            <Badge variant="outline">{key}</Badge>
+            <span className="text-sm">{JSON.stringify(value)}</span>
+          </div>
+        ))}
+      </div>
+    );
   };
 
   if (isLoading) {
@@ -252,22 +249,22 @@ export default function AuditLogs() {
             </DialogDescription>
           </DialogHeader>
           <div className="space-y-6">
-            {selectedLog?.changes && (
+            {logDetail?.changes != null && (
               <div>
                 <h3 className="font-semibold mb-2">Changes</h3>
-                {renderChanges(selectedLog.changes)}
+                {renderChanges(logDetail.changes as Record<string, unknown>)}
               </div>
             )}
-            {selectedLog?.beforeSnapshot && (
+            {logDetail?.beforeSnapshot != null && (
               <div>
                 <h3 className="font-semibold mb-2">Before</h3>
-                {renderSnapshot(selectedLog.beforeSnapshot)}
+                {renderSnapshot(logDetail.beforeSnapshot)}
               </div>
             )}
-            {selectedLog?.afterSnapshot && (
+            {logDetail?.afterSnapshot != null && (
               <div>
                 <h3 className="font-semibold mb-2">After</h3>
-                {renderSnapshot(selectedLog.afterSnapshot)}
+                {renderSnapshot(logDetail.afterSnapshot)}
               </div>
             )}
             {selectedLog?.ipAddress && (
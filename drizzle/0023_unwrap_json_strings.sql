@@ -0,0 +1,7 @@
+-- json() columns were written pre-stringified, so each value was stored as a
+-- JSON string holding the real document and had to be parsed twice on read.
+-- Unwrap those strings into the documents themselves.
+UPDATE `performance_reviews` SET `goals` = CAST(JSON_UNQUOTE(`goals`) AS JSON) WHERE JSON_TYPE(`goals`) = 'STRING';--> statement-breakpoint
+UPDATE `performance_improvement_plans` SET `goals` = CAST(JSON_UNQUOTE(`goals`) AS JSON) WHERE JSON_TYPE(`goals`) = 'STRING';--> statement-breakpoint
+UPDATE `public_applications` SET `answers` = CAST(JSON_UNQUOTE(`answers`) AS JSON) WHERE JSON_TYPE(`answers`) = 'STRING';--> statement-breakpoint
+UPDATE `job_board_settings` SET `custom_questions` = CAST(JSON_UNQUOTE(`custom_questions`) AS JSON) WHERE JSON_TYPE(`custom_questions`) = 'STRING';
@@ -0,0 +1,8 @@
+-- The audit middleware stringified snapshots before createAuditLog stringified
+-- them again; unwrap those double-encoded rows before switching to JSON
+UPDATE `auditLog` SET `beforeSnapshot` = JSON_UNQUOTE(`beforeSnapshot`) WHERE JSON_VALID(`beforeSnapshot`) AND JSON_TYPE(`beforeSnapshot`) = 'STRING';--> statement-breakpoint
+UPDATE `auditLog` SET `afterSnapshot` = JSON_UNQUOTE(`afterSnapshot`) WHERE JSON_VALID(`afterSnapshot`) AND JSON_TYPE(`afterSnapshot`) = 'STRING';--> statement-breakpoint
+UPDATE `auditLog` SET `changes` = JSON_UNQUOTE(`changes`) WHERE JSON_VALID(`changes`) AND JSON_TYPE(`changes`) = 'STRING';--> statement-breakpoint
+ALTER TABLE `auditLog` MODIFY COLUMN `beforeSnapshot` json;--> statement-breakpoint
+ALTER TABLE `auditLog` MODIFY COLUMN `afterSnapshot` json;--> statement-breakpoint
+ALTER TABLE `auditLog` MODIFY COLUMN `changes` json;
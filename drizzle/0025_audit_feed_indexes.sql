@@ -0,0 +1,6 @@
+DROP INDEX `auditLog_userId_idx` ON `auditLog`;--> statement-breakpoint
+DROP INDEX `auditLog_tableName_idx` ON `auditLog`;--> statement-breakpoint
+DROP INDEX `userActivityLog_userId_idx` ON `userActivityLog`;--> statement-breakpoint
+CREATE INDEX `auditLog_userId_createdAt_idx` ON `auditLog` (`userId`,`createdAt`);--> statement-breakpoint
+CREATE INDEX `auditLog_tableName_recordId_createdAt_idx` ON `auditLog` (`tableName`,`recordId`,`createdAt`);--> statement-breakpoint
+CREATE INDEX `userActivityLog_userId_createdAt_idx` ON `userActivityLog` (`userId`,`createdAt`);
@@ -0,0 +1,2 @@
+DROP INDEX `referenceChecks_status_idx` ON `referenceChecks`;--> statement-breakpoint
+CREATE INDEX `referenceChecks_status_sentAt_idx` ON `referenceChecks` (`status`,`sentAt`);
@@ -0,0 +1,3 @@
+-- Case-insensitive collation on candidate emails, so lookups can compare with
+-- plain equality on candidates_email_idx instead of lowercasing both sides
+ALTER TABLE `candidates` MODIFY COLUMN `email` varchar(320) CHARACTER SET utf8mb4 COLLATE utf8mb4_general_ci NOT NULL;
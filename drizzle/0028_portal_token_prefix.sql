@@ -0,0 +1,4 @@
+ALTER TABLE `candidate_portal_tokens` ADD `token_prefix` bigint unsigned;--> statement-breakpoint
+UPDATE `candidate_portal_tokens` SET `token_prefix` = CONV(LEFT(SHA2(`token`, 256), 16), 16, 10);--> statement-breakpoint
+ALTER TABLE `candidate_portal_tokens` MODIFY COLUMN `token_prefix` bigint unsigned NOT NULL;--> statement-breakpoint
+CREATE INDEX `candidate_portal_tokens_token_prefix_idx` ON `candidate_portal_tokens` (`token_prefix`);
@@ -0,0 +1,2 @@
+CREATE INDEX `background_checks_candidate_id_idx` ON `background_checks` (`candidate_id`);--> statement-breakpoint
+CREATE INDEX `assessment_invitations_candidate_id_idx` ON `assessment_invitations` (`candidate_id`);
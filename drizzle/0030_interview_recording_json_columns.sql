@@ -0,0 +1,3 @@
+ALTER TABLE `interviewRecordings` MODIFY COLUMN `keyMoments` json NOT NULL;--> statement-breakpoint
+ALTER TABLE `interviewRecordings` MODIFY COLUMN `strengths` json NOT NULL;--> statement-breakpoint
+ALTER TABLE `interviewRecordings` MODIFY COLUMN `concerns` json NOT NULL;
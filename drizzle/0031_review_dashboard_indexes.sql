@@ -0,0 +1,6 @@
+CREATE INDEX `performance_reviews_employee_id_created_at_idx` ON `performance_reviews` (`employee_id`,`created_at`);--> statement-breakpoint
+CREATE INDEX `goals_employee_id_created_at_idx` ON `goals` (`employee_id`,`created_at`);--> statement-breakpoint
+CREATE INDEX `peer_review_requests_reviewer_id_status_idx` ON `peer_review_requests` (`reviewer_id`,`status`);--> statement-breakpoint
+CREATE INDEX `performance_improvement_plans_employee_id_created_at_idx` ON `performance_improvement_plans` (`employee_id`,`created_at`);--> statement-breakpoint
+CREATE INDEX `public_job_listings_is_published_published_at_idx` ON `public_job_listings` (`is_published`,`published_at`);--> statement-breakpoint
+CREATE INDEX `email_campaign_steps_campaign_id_step_order_idx` ON `email_campaign_steps` (`campaign_id`,`step_order`);
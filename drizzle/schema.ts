@@ -1,4 +1,4 @@
-import { int, mysqlEnum, mysqlTable, text, timestamp, varchar, index, json, date, boolean } from "drizzle-orm/mysql-core";
+import { int, bigint, mysqlEnum, mysqlTable, text, timestamp, varchar, index, json, date, boolean } from "drizzle-orm/mysql-core";
 
 /**
  * Core user table backing auth flow.
@@ -31,10 +31,16 @@ export type InsertUser = typeof users.$inferInsert;
   id: int("id").primaryKey().autoincrement(),
   candidateId: int("candidate_id").notNull(),
   token: varchar("token", { length: 255 }).notNull().unique(),
+  // First 8 bytes of SHA-256(token); lookups walk this integer index and
+  // then confirm the full token on the matching row. Uniqueness stays on the
+  // token itself.
+  tokenPrefix: bigint("token_prefix", { mode: "bigint", unsigned: true }).notNull(),
   expiresAt: timestamp("expires_at").notNull(),
   usedAt: timestamp("used_at"),
   createdAt: timestamp("created_at").notNull().defaultNow(),
-});
+}, (table) => ({
+  tokenPrefixIdx: index("candidate_portal_tokens_token_prefix_idx").on(table.tokenPrefix),
+}));
 
 export type InsertCandidatePortalToken = typeof candidatePortalTokens.$inferInsert;
 
@@ -89,7 +95,9 @@ export const backgroundChecks = mysqlTable('background_checks', {
   completedAt: timestamp('completed_at'),
   reportUrl: text('report_url'),
   details: text('details'), // JSON string
-});
+}, (table) => ({
+  candidateIdIdx: index("background_checks_candidate_id_idx").on(table.candidateId),
+}));
 
 export const assessmentInvitations = mysqlTable('assessment_invitations', {
   id: int('id').autoincrement().primaryKey(),
@@ -104,7 +112,9 @@ export const assessmentInvitations = mysqlTable('assessment_invitations', {
   completedAt: timestamp('completed_at'),
   expiresAt: timestamp('expires_at').notNull(),
   createdAt: timestamp('created_at').defaultNow().notNull(),
-});
+}, (table) => ({
+  candidateIdIdx: index("assessment_invitations_candidate_id_idx").on(table.candidateId),
+}));
 
 export const dashboardLayouts = mysqlTable('dashboard_layouts', {
   id: int("id").autoincrement().primaryKey(),
@@ -310,6 +320,8 @@ export const candidates = mysqlTable("candidates", {
   id: int("id").autoincrement().primaryKey(),
   jobId: int("jobId").notNull(),
   name: varchar("name", { length: 255 }).notNull(),
+  // Collated utf8mb4_general_ci (migration 0027): lookups are case-insensitive
+  // and still use candidates_email_idx
   email: varchar("email", { length: 320 }).notNull(),
   phone: varchar("phone", { length: 50 }),
   resumeUrl: varchar("resumeUrl", { length: 500 }),
@@ -555,7 +567,10 @@ export const referenceChecks = mysqlTable("referenceChecks", {
   updatedAt: timestamp("updatedAt").defaultNow().onUpdateNow().notNull(),
 }, (table) => ({
   candidateIdIdx: index("referenceChecks_candidateId_idx").on(table.candidateId),
-  statusIdx: index("referenceChecks_status_idx").on(table.status),
+  // The daily expiry and reminder jobs read status = 'sent' ordered by
+  // sentAt; MySQL has no partial indexes, so leading with status keeps the
+  // open checks in one contiguous, already-ordered range instead
+  statusSentAtIdx: index("referenceChecks_status_sentAt_idx").on(table.status, table.sentAt),
   referenceEmailIdx: index("referenceChecks_referenceEmail_idx").on(table.referenceEmail),
 }));
 
@@ -597,7 +612,8 @@ export const userActivityLog = mysqlTable("userActivityLog", {
   metadata: text("metadata"), // JSON object with additional context
   createdAt: timestamp("createdAt").defaultNow().notNull(),
 }, (table) => ({
-  userIdIdx: index("userActivityLog_userId_idx").on(table.userId),
+  // A user's activity is always read newest first
+  userCreatedAtIdx: index("userActivityLog_userId_createdAt_idx").on(table.userId, table.createdAt),
   actionIdx: index("userActivityLog_action_idx").on(table.action),
   resourceIdx: index("userActivityLog_resource_idx").on(table.resource),
   createdAtIdx: index("userActivityLog_createdAt_idx").on(table.createdAt),
@@ -616,16 +632,18 @@ export const auditLog = mysqlTable("auditLog", {
   action: mysqlEnum("action", ["create", "update", "delete"]).notNull(),
   tableName: varchar("tableName", { length: 100 }).notNull(),
   recordId: int("recordId").notNull(),
-  beforeSnapshot: text("beforeSnapshot"), // JSON snapshot before change
-  afterSnapshot: text("afterSnapshot"), // JSON snapshot after change
-  changes: text("changes"), // JSON object showing field-level changes
+  beforeSnapshot: json("beforeSnapshot"), // Snapshot before change
+  afterSnapshot: json("afterSnapshot"), // Snapshot after change
+  changes: json("changes"), // Field-level changes: { field: { from, to } }
   ipAddress: varchar("ipAddress", { length: 45 }),
   userAgent: text("userAgent"),
   createdAt: timestamp("createdAt").defaultNow().notNull(),
 }, (table) => ({
-  userIdIdx: index("auditLog_userId_idx").on(table.userId),
+  // Audit queries filter by user or by record and read newest first; the
+  // trailing createdAt lets these return rows in order without a sort
+  userCreatedAtIdx: index("auditLog_userId_createdAt_idx").on(table.userId, table.createdAt),
+  recordCreatedAtIdx: index("auditLog_tableName_recordId_createdAt_idx").on(table.tableName, table.recordId, table.createdAt),
   actionIdx: index("auditLog_action_idx").on(table.action),
-  tableNameIdx: index("auditLog_tableName_idx").on(table.tableName),
   recordIdIdx: index("auditLog_recordId_idx").on(table.recordId),
   createdAtIdx: index("auditLog_createdAt_idx").on(table.createdAt),
 }));
@@ -694,10 +712,10 @@ export const interviewRecordings = mysqlTable("interviewRecordings", {
   videoUrl: text("videoUrl").notNull(),
   transcription: text("transcription").notNull(),
   sentiment: mysqlEnum("sentiment", ["positive", "neutral", "negative"]).notNull(),
-  keyMoments: text("keyMoments").notNull(), // JSON array
+  keyMoments: json("keyMoments").notNull(), // JSON array
   score: int("score").notNull(),
-  strengths: text("strengths").notNull(), // JSON array
-  concerns: text("concerns").notNull(), // JSON array
+  strengths: json("strengths").notNull(), // JSON array
+  concerns: json("concerns").notNull(), // JSON array
   processingTime: int("processingTime").notNull(), // milliseconds
   createdAt: timestamp("createdAt").defaultNow().notNull(),
 }, (table) => ({
@@ -793,7 +811,10 @@ export const performanceReviews = mysqlTable("performance_reviews", {
   completedAt: timestamp("completed_at"),
   createdAt: timestamp("created_at").defaultNow(),
   updatedAt: timestamp("updated_at").defaultNow().onUpdateNow(),
-});
+}, (table) => ({
+  // An employee's reviews are listed newest first
+  employeeCreatedAtIdx: index("performance_reviews_employee_id_created_at_idx").on(table.employeeId, table.createdAt),
+}));
 
 export const reviewCycles = mysqlTable("review_cycles", {
   id: int("id").primaryKey().autoincrement(),
@@ -821,7 +842,9 @@ export const goals = mysqlTable("goals", {
   createdBy: int("created_by").notNull().references(() => users.id),
   createdAt: timestamp("created_at").defaultNow(),
   updatedAt: timestamp("updated_at").defaultNow().onUpdateNow(),
-});
+}, (table) => ({
+  employeeCreatedAtIdx: index("goals_employee_id_created_at_idx").on(table.employeeId, table.createdAt),
+}));
 
 export const peerReviewRequests = mysqlTable("peer_review_requests", {
   id: int("id").primaryKey().autoincrement(),
@@ -832,7 +855,10 @@ export const peerReviewRequests = mysqlTable("peer_review_requests", {
   requestedAt: timestamp("requested_at").defaultNow(),
   respondedAt: timestamp("responded_at"),
   completedAt: timestamp("completed_at"),
-});
+}, (table) => ({
+  // A reviewer's pending requests
+  reviewerStatusIdx: index("peer_review_requests_reviewer_id_status_idx").on(table.reviewerId, table.status),
+}));
 
 export const performanceImprovementPlans = mysqlTable("performance_improvement_plans", {
   id: int("id").primaryKey().autoincrement(),
@@ -848,7 +874,9 @@ export const performanceImprovementPlans = mysqlTable("performance_improvement_p
   outcome: text("outcome"),
   createdAt: timestamp("created_at").defaultNow(),
   updatedAt: timestamp("updated_at").defaultNow().onUpdateNow(),
-});
+}, (table) => ({
+  employeeCreatedAtIdx: index("performance_improvement_plans_employee_id_created_at_idx").on(table.employeeId, table.createdAt),
+}));
 
 
 // Public Job Board
@@ -865,7 +893,10 @@ export const publicJobListings = mysqlTable("public_job_listings", {
   metaDescription: text("meta_description"),
   createdAt: timestamp("created_at").defaultNow(),
   updatedAt: timestamp("updated_at").defaultNow().onUpdateNow(),
-});
+}, (table) => ({
+  // The public board lists published jobs, newest first
+  publishedIdx: index("public_job_listings_is_published_published_at_idx").on(table.isPublished, table.publishedAt),
+}));
 
 export const publicApplications = mysqlTable("public_applications", {
   id: int("id").primaryKey().autoincrement(),
@@ -926,7 +957,9 @@ export const emailCampaignSteps = mysqlTable("email_campaign_steps", {
   delayDays: int("delay_days").default(0), // days after trigger to send
   delayHours: int("delay_hours").default(0), // hours after trigger to send
   createdAt: timestamp("created_at").defaultNow(),
-});
+}, (table) => ({
+  campaignStepOrderIdx: index("email_campaign_steps_campaign_id_step_order_idx").on(table.campaignId, table.stepOrder),
+}));
 
 export const emailCampaignEnrollments = mysqlTable("email_campaign_enrollments", {
   id: int("id").primaryKey().autoincrement(),
@@ -112,9 +112,9 @@ export const auditMiddleware = async (opts: { ctx: TrpcContext; next: any }) =>
           action: auditCtx.action,
           tableName: auditCtx.tableName,
           recordId: auditCtx.recordId,
-          beforeSnapshot: auditCtx.beforeSnapshot ? JSON.stringify(auditCtx.beforeSnapshot) : undefined,
-          afterSnapshot: auditCtx.afterSnapshot ? JSON.stringify(auditCtx.afterSnapshot) : undefined,
-          changes: JSON.stringify(changes),
+          beforeSnapshot: auditCtx.beforeSnapshot,
+          afterSnapshot: auditCtx.afterSnapshot,
+          changes,
           ipAddress: (ctx.req as any).ip || (ctx.req as any).connection?.remoteAddress || undefined,
           userAgent: ctx.req.headers["user-agent"] || undefined,
         });
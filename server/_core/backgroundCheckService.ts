@@ -3,6 +3,8 @@
  * Integrates with Checkr and Sterling for automated background screening
  */
 
+import { randomBytes } from "crypto";
+
 export interface BackgroundCheckProvider {
   id: string;
   name: string;
@@ -104,7 +106,7 @@ export class CheckrService {
 
   async initiateCheck(request: BackgroundCheckRequest): Promise<BackgroundCheckResult> {
     // Mock implementation - in production, call Checkr API
-    const checkId = `chk_${Math.random().toString(36).substring(7)}`;
+    const checkId = `chk_${randomBytes(4).toString("hex")}`;
 
     return {
       id: checkId,
@@ -189,7 +191,7 @@ export class SterlingService {
 
   async initiateCheck(request: BackgroundCheckRequest): Promise<BackgroundCheckResult> {
     // Mock implementation - in production, call Sterling API
-    const checkId = `stl_${Math.random().toString(36).substring(7)}`;
+    const checkId = `stl_${randomBytes(4).toString("hex")}`;
 
     return {
       id: checkId,
@@ -1,9 +1,10 @@
 import { google } from 'googleapis';
+import { ENV } from './env';
 
 // Google Calendar credentials from environment
-const GOOGLE_CALENDAR_CLIENT_ID = process.env.GOOGLE_CALENDAR_CLIENT_ID;
-const GOOGLE_CALENDAR_CLIENT_SECRET = process.env.GOOGLE_CALENDAR_CLIENT_SECRET;
-const GOOGLE_CALENDAR_REDIRECT_URI = process.env.GOOGLE_CALENDAR_REDIRECT_URI;
+const GOOGLE_CALENDAR_CLIENT_ID = ENV.googleCalendarClientId;
+const GOOGLE_CALENDAR_CLIENT_SECRET = ENV.googleCalendarClientSecret;
+const GOOGLE_CALENDAR_REDIRECT_URI = ENV.googleCalendarRedirectUri;
 
 export interface CalendarEvent {
   id?: string;
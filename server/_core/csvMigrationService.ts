@@ -68,6 +68,30 @@ export const JOB_FIELDS: CSVField[] = [
   { name: 'status', type: 'string', required: false },
 ];
 
+/**
+ * Per-type value checks, looked up once per cell instead of walking a switch
+ */
+const FIELD_TYPE_VALIDATORS: Partial<
+  Record<CSVField['type'], { isValid: (value: any) => boolean; error: string }>
+> = {
+  email: {
+    isValid: (value) => /^[^\s@]+@[^\s@]+\.[^\s@]+$/.test(value),
+    error: 'Invalid email format',
+  },
+  phone: {
+    isValid: (value) => /^\+?[\d\s\-()]+$/.test(value),
+    error: 'Invalid phone format',
+  },
+  number: {
+    isValid: (value) => !isNaN(Number(value)),
+    error: 'Must be a number',
+  },
+  date: {
+    isValid: (value) => !isNaN(Date.parse(value)),
+    error: 'Invalid date format',
+  },
+};
+
 export class CSVMigrationService {
   /**
    * Parse CSV file and detect columns
@@ -138,47 +162,14 @@ export class CSVMigrationService {
 
       // Type validation
       if (value && value.toString().trim() !== '') {
-        switch (field.type) {
-          case 'email':
-            if (!/^[^\s@]+@[^\s@]+\.[^\s@]+$/.test(value)) {
-              errors.push({
-                row: rowNumber,
-                field: map.targetField,
-                value,
-                error: 'Invalid email format',
-              });
-            }
-            break;
-          case 'phone':
-            if (!/^\+?[\d\s\-()]+$/.test(value)) {
-              errors.push({
-                row: rowNumber,
-                field: map.targetField,
-                value,
-                error: 'Invalid phone format',
-              });
-            }
-            break;
-          case 'number':
-            if (isNaN(Number(value))) {
-              errors.push({
-                row: rowNumber,
-                field: map.targetField,
-                value,
-                error: 'Must be a number',
-              });
-            }
-            break;
-          case 'date':
-            if (isNaN(Date.parse(value))) {
-              errors.push({
-                row: rowNumber,
-                field: map.targetField,
-                value,
-                error: 'Invalid date format',
-              });
-            }
-            break;
+        const validator = FIELD_TYPE_VALIDATORS[field.type];
+        if (validator && !validator.isValid(value)) {
+          errors.push({
+            row: rowNumber,
+            field: map.targetField,
+            value,
+            error: validator.error,
+          });
         }
       }
     }
@@ -1,4 +1,4 @@
-import { invokeLLM } from "./llm";
+import { invokeLLMCached, type InvokeResult } from "./llm";
 
 /**
  * AI-powered document review service
@@ -36,11 +36,21 @@ export interface DocumentValidationResult {
   autoApprove: boolean;
 }
 
+// Structured responses are only usable (and only cached) once they parse
+function parseJsonContent(response: InvokeResult) {
+  const content = response.choices[0]?.message?.content;
+  if (typeof content !== "string" || !content) {
+    throw new Error("No response from LLM");
+  }
+
+  return JSON.parse(content);
+}
+
 /**
  * Parse resume using AI
  */
 export async function parseResume(resumeText: string): Promise<ResumeParseResult> {
-  const response = await invokeLLM({
+  return invokeLLMCached<ResumeParseResult>({
     messages: [
       {
         role: "system",
@@ -116,14 +126,7 @@ export async function parseResume(resumeText: string): Promise<ResumeParseResult
         },
       },
     },
-  });
-
-  const content = response.choices[0].message.content;
-  if (!content) {
-    throw new Error("No response from LLM");
-  }
-
-  return JSON.parse(content);
+  }, parseJsonContent);
 }
 
 /**
@@ -138,7 +141,7 @@ export async function validateDocument(
     ? `\n\nRequired elements: ${requirements.join(", ")}`
     : "";
 
-  const response = await invokeLLM({
+  return invokeLLMCached<DocumentValidationResult>({
     messages: [
       {
         role: "system",
@@ -185,14 +188,7 @@ export async function validateDocument(
         },
       },
     },
-  });
-
-  const content = response.choices[0].message.content;
-  if (!content) {
-    throw new Error("No response from LLM");
-  }
-
-  return JSON.parse(content);
+  }, parseJsonContent);
 }
 
 /**
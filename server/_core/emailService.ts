@@ -65,7 +65,7 @@ export async function sendMagicLinkEmail(
   token: string,
   candidateName?: string
 ): Promise<EmailResult> {
-  const magicLink = `${process.env.VITE_APP_URL || "http://localhost:3000"}/candidate-portal?token=${token}`;
+  const magicLink = `${ENV.appUrl || "http://localhost:3000"}/candidate-portal?token=${token}`;
   
   const html = `
     <!DOCTYPE html>
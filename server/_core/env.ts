@@ -1,7 +1,41 @@
-export const ENV = {
+// Upper bound on outbound LLM calls in flight from one process; past this the
+// upstream rate limits, not our concurrency, decide throughput
+const MAX_LLM_CONCURRENCY = 16;
+
+function parseConcurrency(value: string | undefined, fallback: number) {
+  const parsed = Number.parseInt(value ?? "", 10);
+  if (!Number.isFinite(parsed) || parsed < 1) return fallback;
+  return Math.min(parsed, MAX_LLM_CONCURRENCY);
+}
+
+function parsePositiveInt(value: string | undefined, fallback: number) {
+  const parsed = Number.parseInt(value ?? "", 10);
+  return Number.isFinite(parsed) && parsed > 0 ? parsed : fallback;
+}
+
+// Comma-separated allow-list, split once so origin checks are a set lookup
+function parseOrigins(value: string | undefined): ReadonlySet<string> {
+  return new Set(
+    (value ?? "")
+      .split(",")
+      .map(origin => origin.trim())
+      .filter(Boolean)
+  );
+}
+
+const dbPoolSize = parsePositiveInt(process.env.DB_POOL_SIZE, 10);
+
+export const ENV = Object.freeze({
   appId: process.env.VITE_APP_ID ?? "",
   cookieSecret: process.env.JWT_SECRET ?? "",
   databaseUrl: process.env.DATABASE_URL ?? "",
+  dbPoolSize,
+  // mysql2 only closes idle connections while maxIdle is below the pool size;
+  // at the pool size they are kept forever
+  dbPoolMaxIdle: Math.min(
+    parsePositiveInt(process.env.DB_POOL_MAX_IDLE, Math.ceil(dbPoolSize / 2)),
+    dbPoolSize
+  ),
   oAuthServerUrl: process.env.OAUTH_SERVER_URL ?? "",
   ownerOpenId: process.env.OWNER_OPEN_ID ?? "",
   isProduction: process.env.NODE_ENV === "production",
@@ -11,4 +45,15 @@ export const ENV = {
   FROM_EMAIL: process.env.FROM_EMAIL ?? "noreply@hrplatform.com",
   SIGNSMART_API_URL: process.env.SIGNSMART_API_URL ?? "",
   SIGNSMART_API_KEY: process.env.SIGNSMART_API_KEY ?? "",
-};
+  logLevel: (process.env.LOG_LEVEL ?? "info").toLowerCase(),
+  llmConcurrency: parseConcurrency(process.env.LLM_CONCURRENCY, 5),
+  appUrl: process.env.VITE_APP_URL ?? "",
+  corsOrigins: parseOrigins(process.env.CORS_ORIGINS),
+  adminEmail: process.env.ADMIN_EMAIL || "admin@example.com",
+  emailProvider: process.env.EMAIL_PROVIDER?.toLowerCase() || "manus",
+  emailFrom: process.env.EMAIL_FROM || "noreply@example.com",
+  emailFromName: process.env.EMAIL_FROM_NAME || "HR Platform",
+  googleCalendarClientId: process.env.GOOGLE_CALENDAR_CLIENT_ID || "",
+  googleCalendarClientSecret: process.env.GOOGLE_CALENDAR_CLIENT_SECRET || "",
+  googleCalendarRedirectUri: process.env.GOOGLE_CALENDAR_REDIRECT_URI || "",
+});
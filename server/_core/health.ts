@@ -0,0 +1,69 @@
+import type { Express } from "express";
+import type { PoolConnection } from "mysql2/promise";
+import { getDb } from "../db";
+
+/**
+ * Health probes for load balancers and orchestrators.
+ * Registered ahead of every other middleware so a probe never pays for
+ * metrics, body parsing, session auth or tRPC dispatch.
+ */
+
+const LIVE_BODY = JSON.stringify({ status: "alive" });
+const READY_BODY = JSON.stringify({ status: "ready" });
+const NOT_READY_BODY = JSON.stringify({ status: "unavailable" });
+
+// Probes arrive in bursts from several replicas; one database round trip per
+// second answers all of them
+const READINESS_CACHE_MS = 1000;
+
+let readiness = { checkedAt: -Infinity, ok: false };
+let pendingCheck: Promise<boolean> | null = null;
+
+async function checkDatabase(): Promise<boolean> {
+  const db = await getDb();
+  if (!db) return false;
+
+  let connection: PoolConnection | undefined;
+  try {
+    // A protocol-level ping on a pooled connection: proves the pool can reach
+    // MySQL without sending SQL to be parsed and answered with a result set
+    connection = await db.$client.promise().getConnection();
+    await connection.ping();
+    return true;
+  } catch (error) {
+    console.warn("[Health] Database check failed:", error);
+    return false;
+  } finally {
+    connection?.release();
+  }
+}
+
+function isReady(): Promise<boolean> | boolean {
+  if (performance.now() - readiness.checkedAt < READINESS_CACHE_MS) {
+    return readiness.ok;
+  }
+
+  // Concurrent probes share one in-flight check
+  if (!pendingCheck) {
+    pendingCheck = checkDatabase().then(ok => {
+      readiness = { checkedAt: performance.now(), ok };
+      pendingCheck = null;
+      return ok;
+    });
+  }
+  return pendingCheck;
+}
+
+export function registerHealthRoutes(app: Express) {
+  app.get("/api/health/live", (_req, res) => {
+    res.status(200).set("Content-Type", "application/json").end(LIVE_BODY);
+  });
+
+  app.get("/api/health/ready", async (_req, res) => {
+    const ok = await isReady();
+    res
+      .status(ok ? 200 : 503)
+      .set("Content-Type", "application/json")
+      .end(ok ? READY_BODY : NOT_READY_BODY);
+  });
+}
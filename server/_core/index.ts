@@ -3,14 +3,19 @@ import express from "express";
 import { createServer } from "http";
 import net from "net";
 import { createExpressMiddleware } from "@trpc/server/adapters/express";
+import { registerHealthRoutes } from "./health";
 import { registerOAuthRoutes } from "./oauth";
 import { appRouter } from "../routers";
 import { createContext } from "./context";
+import { sdk } from "./sdk";
 import { serveStatic, setupVite } from "./vite";
 import { initializeJobScheduler } from "../services/jobScheduler";
 import { initializeSocketIO } from "../services/realtimeNotifications";
 import { createPerformanceMiddleware } from "../services/performanceMonitoring";
 
+// Request bodies carry base64 file uploads
+const MAX_BODY_SIZE_BYTES = 50 * 1024 * 1024;
+
 function isPortAvailable(port: number): Promise<boolean> {
   return new Promise(resolve => {
     const server = net.createServer();
@@ -33,22 +38,27 @@ async function findAvailablePort(startPort: number = 3000): Promise<number> {
 async function startServer() {
   const app = express();
   const server = createServer(app);
-  // Configure body parser with larger size limit for file uploads
-  app.use(express.json({ limit: "50mb" }));
-  app.use(express.urlencoded({ limit: "50mb", extended: true }));
-  
+
+  // Liveness/readiness probes under /api/health, ahead of all other middleware
+  registerHealthRoutes(app);
   // Performance monitoring middleware
   app.use(createPerformanceMiddleware());
-  // OAuth callback under /api/oauth/callback
-  registerOAuthRoutes(app);
-  // tRPC API
+  // tRPC API. Mounted ahead of the Express body parsers: tRPC reads and parses
+  // the request body itself, and a body already parsed by express.json would
+  // be re-serialized and parsed a second time.
   app.use(
     "/api/trpc",
     createExpressMiddleware({
       router: appRouter,
       createContext,
+      maxBodySize: MAX_BODY_SIZE_BYTES,
     })
   );
+  // Configure body parser with larger size limit for file uploads
+  app.use(express.json({ limit: MAX_BODY_SIZE_BYTES }));
+  app.use(express.urlencoded({ limit: MAX_BODY_SIZE_BYTES, extended: true }));
+  // OAuth callback under /api/oauth/callback
+  registerOAuthRoutes(app);
   // development mode uses Vite, production mode uses static files
   if (process.env.NODE_ENV === "development") {
     await setupVite(app, server);
@@ -57,7 +67,13 @@ async function startServer() {
   }
 
   const preferredPort = parseInt(process.env.PORT || "3000");
-  const port = await findAvailablePort(preferredPort);
+  // Only hunt for a free port in local development. Deployed instances must
+  // bind exactly what the process manager / load balancer expects, so a busy
+  // port surfaces as a startup error instead of a silent move.
+  const port =
+    process.env.NODE_ENV === "development"
+      ? await findAvailablePort(preferredPort)
+      : preferredPort;
 
   if (port !== preferredPort) {
     console.log(`Port ${preferredPort} is busy, using port ${port} instead`);
@@ -65,6 +81,7 @@ async function startServer() {
 
   // Initialize Socket.IO before starting server
   initializeSocketIO(server);
+  await sdk.warmUp();
   
   server.listen(port, () => {
     console.log(`Server running on http://localhost:${port}/`);
@@ -3,6 +3,8 @@
  * Auto-post jobs to Indeed, LinkedIn, and ZipRecruiter
  */
 
+import { randomBytes } from "crypto";
+
 export interface JobBoardProvider {
   id: string;
   name: string;
@@ -43,7 +45,7 @@ export class IndeedJobBoardService {
 
   async postJob(job: JobPosting): Promise<SyndicationResult> {
     // Mock implementation - in production, call Indeed API
-    const externalJobId = `indeed_${Math.random().toString(36).substring(7)}`;
+    const externalJobId = `indeed_${randomBytes(4).toString("hex")}`;
     const postUrl = `https://www.indeed.com/viewjob?jk=${externalJobId}`;
 
     return {
@@ -86,7 +88,7 @@ export class LinkedInJobBoardService {
 
   async postJob(job: JobPosting): Promise<SyndicationResult> {
     // Mock implementation
-    const externalJobId = `linkedin_${Math.random().toString(36).substring(7)}`;
+    const externalJobId = `linkedin_${randomBytes(4).toString("hex")}`;
     const postUrl = `https://www.linkedin.com/jobs/view/${externalJobId}`;
 
     return {
@@ -129,7 +131,7 @@ export class ZipRecruiterJobBoardService {
 
   async postJob(job: JobPosting): Promise<SyndicationResult> {
     // Mock implementation
-    const externalJobId = `zip_${Math.random().toString(36).substring(7)}`;
+    const externalJobId = `zip_${randomBytes(4).toString("hex")}`;
     const postUrl = `https://www.ziprecruiter.com/jobs/${externalJobId}`;
 
     return {
@@ -1,3 +1,4 @@
+import { createHash } from "crypto";
 import { ENV } from "./env";
 
 export type Role = "system" | "user" | "assistant" | "tool" | "function";
@@ -265,9 +266,7 @@ const normalizeResponseFormat = ({
   };
 };
 
-export async function invokeLLM(params: InvokeParams): Promise<InvokeResult> {
-  assertApiKey();
-
+const buildPayload = (params: InvokeParams): Record<string, unknown> => {
   const {
     messages,
     tools,
@@ -312,13 +311,17 @@ export async function invokeLLM(params: InvokeParams): Promise<InvokeResult> {
     payload.response_format = normalizedResponseFormat;
   }
 
+  return payload;
+};
+
+const postCompletion = async (body: string): Promise<InvokeResult> => {
   const response = await fetch(resolveApiUrl(), {
     method: "POST",
     headers: {
       "content-type": "application/json",
       authorization: `Bearer ${ENV.forgeApiKey}`,
     },
-    body: JSON.stringify(payload),
+    body,
   });
 
   if (!response.ok) {
@@ -329,4 +332,65 @@ export async function invokeLLM(params: InvokeParams): Promise<InvokeResult> {
   }
 
   return (await response.json()) as InvokeResult;
+};
+
+export async function invokeLLM(params: InvokeParams): Promise<InvokeResult> {
+  assertApiKey();
+  return postCompletion(JSON.stringify(buildPayload(params)));
+}
+
+// Analyses are re-requested with unchanged inputs all the time (a recruiter
+// re-scoring the same candidate, a document re-validated on every review)
+const CACHED_RESULT_TTL_MS = 5 * 60 * 1000;
+// Hard cap on cached responses; the oldest entry makes room for a new one
+const MAX_CACHED_RESULTS = 500;
+
+// sha256 of the request body -> parsed response (promise, so concurrent
+// identical requests share one upstream call)
+const resultCache = new Map<string, { expiresAt: number; value: Promise<unknown> }>();
+
+/**
+ * invokeLLM for requests whose answer depends only on the prompt: identical
+ * requests within CACHED_RESULT_TTL_MS reuse the earlier answer instead of
+ * calling the model again. The key is a hash of the exact payload sent, so
+ * any change to the messages or response format is a different entry.
+ * Not for conversations or anything expected to vary between calls.
+ *
+ * `parse` turns the response into what the caller needs and should throw on
+ * anything unusable. Only parsed results are cached: a failed call or a
+ * response `parse` rejects is dropped, so the next request asks again. Each
+ * payload must always be paired with the same `parse`.
+ */
+export async function invokeLLMCached<T>(
+  params: InvokeParams,
+  parse: (result: InvokeResult) => T
+): Promise<T> {
+  assertApiKey();
+
+  const body = JSON.stringify(buildPayload(params));
+  const key = createHash("sha256").update(body).digest("base64");
+  const now = performance.now();
+  const cached = resultCache.get(key);
+  if (cached && cached.expiresAt > now) {
+    return cached.value as Promise<T>;
+  }
+
+  if (cached) {
+    resultCache.delete(key);
+  } else if (resultCache.size >= MAX_CACHED_RESULTS) {
+    const oldest = resultCache.keys().next().value;
+    if (oldest !== undefined) {
+      resultCache.delete(oldest);
+    }
+  }
+
+  const value = postCompletion(body).then(parse);
+  resultCache.set(key, { expiresAt: now + CACHED_RESULT_TTL_MS, value });
+  value.catch(() => {
+    // Never serve a failed call or an unusable answer from cache
+    if (resultCache.get(key)?.value === value) {
+      resultCache.delete(key);
+    }
+  });
+  return value;
 }
@@ -2,20 +2,39 @@ import { COOKIE_NAME, ONE_YEAR_MS } from "@shared/const";
 import type { Express, Request, Response } from "express";
 import * as db from "../db";
 import { getSessionCookieOptions } from "./cookies";
+import { ENV } from "./env";
 import { sdk } from "./sdk";
 
+// Callback failures answer with fixed bodies; serialize them once at load
+const MISSING_PARAMS_BODY = JSON.stringify({ error: "code and state are required" });
+const MISSING_OPEN_ID_BODY = JSON.stringify({ error: "openId missing from user info" });
+const CALLBACK_FAILED_BODY = JSON.stringify({ error: "OAuth callback failed" });
+
+function sendJsonError(res: Response, status: number, body: string) {
+  res.status(status).set("Content-Type", "application/json").end(body);
+}
+
 function getQueryParam(req: Request, key: string): string | undefined {
   const value = req.query[key];
   return typeof value === "string" ? value : undefined;
 }
 
 export function registerOAuthRoutes(app: Express) {
+  // Reported once at server startup rather than whenever sdk.ts is imported
+  // (tests, scripts and tooling all import it)
+  console.log("[OAuth] Initialized with baseURL:", ENV.oAuthServerUrl);
+  if (!ENV.oAuthServerUrl) {
+    console.error(
+      "[OAuth] ERROR: OAUTH_SERVER_URL is not configured! Set OAUTH_SERVER_URL environment variable."
+    );
+  }
+
   app.get("/api/oauth/callback", async (req: Request, res: Response) => {
     const code = getQueryParam(req, "code");
     const state = getQueryParam(req, "state");
 
     if (!code || !state) {
-      res.status(400).json({ error: "code and state are required" });
+      sendJsonError(res, 400, MISSING_PARAMS_BODY);
       return;
     }
 
@@ -24,7 +43,7 @@ export function registerOAuthRoutes(app: Express) {
       const userInfo = await sdk.getUserInfo(tokenResponse.accessToken);
 
       if (!userInfo.openId) {
-        res.status(400).json({ error: "openId missing from user info" });
+        sendJsonError(res, 400, MISSING_OPEN_ID_BODY);
         return;
       }
 
@@ -47,7 +66,7 @@ export function registerOAuthRoutes(app: Express) {
       res.redirect(302, "/");
     } catch (error) {
       console.error("[OAuth] Callback failed", error);
-      res.status(500).json({ error: "OAuth callback failed" });
+      sendJsonError(res, 500, CALLBACK_FAILED_BODY);
     }
   });
 }
@@ -24,19 +24,15 @@ export type SessionPayload = {
   name: string;
 };
 
+// How stale users.lastSignedIn may get before an authenticated request refreshes it
+const LAST_SIGNED_IN_REFRESH_MS = 15 * 60 * 1000;
+
 const EXCHANGE_TOKEN_PATH = `/webdev.v1.WebDevAuthPublicService/ExchangeToken`;
 const GET_USER_INFO_PATH = `/webdev.v1.WebDevAuthPublicService/GetUserInfo`;
 const GET_USER_INFO_WITH_JWT_PATH = `/webdev.v1.WebDevAuthPublicService/GetUserInfoWithJwt`;
 
 class OAuthService {
-  constructor(private client: ReturnType<typeof axios.create>) {
-    console.log("[OAuth] Initialized with baseURL:", ENV.oAuthServerUrl);
-    if (!ENV.oAuthServerUrl) {
-      console.error(
-        "[OAuth] ERROR: OAUTH_SERVER_URL is not configured! Set OAUTH_SERVER_URL environment variable."
-      );
-    }
-  }
+  constructor(private client: ReturnType<typeof axios.create>) {}
 
   private decodeState(state: string): string {
     const redirectUri = atob(state);
@@ -145,18 +141,52 @@ class SDKServer {
     } as GetUserInfoResponse;
   }
 
-  private parseCookies(cookieHeader: string | undefined) {
-    if (!cookieHeader) {
-      return new Map<string, string>();
+  private readSessionCookie(cookieHeader: string | undefined) {
+    // Look before parsing: requests without our cookie skip the header parse
+    if (!cookieHeader || !cookieHeader.includes(COOKIE_NAME)) {
+      return undefined;
     }
 
-    const parsed = parseCookieHeader(cookieHeader);
-    return new Map(Object.entries(parsed));
+    return parseCookieHeader(cookieHeader)[COOKIE_NAME];
   }
 
+  private sessionSecretKey: Promise<CryptoKey> | null = null;
+
+  /**
+   * HMAC key for session JWTs, imported once. Handing jose raw bytes makes it
+   * re-import the key on every sign/verify.
+   */
   private getSessionSecret() {
-    const secret = ENV.cookieSecret;
-    return new TextEncoder().encode(secret);
+    if (!this.sessionSecretKey) {
+      this.sessionSecretKey = crypto.subtle
+        .importKey(
+          "raw",
+          new TextEncoder().encode(ENV.cookieSecret),
+          { name: "HMAC", hash: "SHA-256" },
+          false,
+          ["sign", "verify"]
+        )
+        .catch(error => {
+          // Don't keep a rejected import (and its error) cached for the
+          // life of the process; the next call retries
+          this.sessionSecretKey = null;
+          throw error;
+        });
+    }
+    return this.sessionSecretKey;
+  }
+
+  /**
+   * Import the session key at startup so the first requests after boot (or
+   * after a deploy, when every client reconnects at once) don't wait on it.
+   * A failure is left for the request path to retry.
+   */
+  async warmUp(): Promise<void> {
+    try {
+      await this.getSessionSecret();
+    } catch (error) {
+      console.warn("[Auth] Session key import failed; retrying on first use", error);
+    }
   }
 
   /**
@@ -185,14 +215,16 @@ class SDKServer {
     const issuedAt = Date.now();
     const expiresInMs = options.expiresInMs ?? ONE_YEAR_MS;
     const expirationSeconds = Math.floor((issuedAt + expiresInMs) / 1000);
-    const secretKey = this.getSessionSecret();
+    const secretKey = await this.getSessionSecret();
 
     return new SignJWT({
       openId: payload.openId,
       appId: payload.appId,
       name: payload.name,
     })
-      .setProtectedHeader({ alg: "HS256", typ: "JWT" })
+      // No "typ" header: verification never checks it, and it's ~16 bytes of
+      // cookie on every request
+      .setProtectedHeader({ alg: "HS256" })
       .setExpirationTime(expirationSeconds)
       .sign(secretKey);
   }
@@ -201,12 +233,12 @@ class SDKServer {
     cookieValue: string | undefined | null
   ): Promise<{ openId: string; appId: string; name: string } | null> {
     if (!cookieValue) {
-      console.warn("[Auth] Missing session cookie");
+      // Anonymous request; not worth a log line per hit
       return null;
     }
 
     try {
-      const secretKey = this.getSessionSecret();
+      const secretKey = await this.getSessionSecret();
       const { payload } = await jwtVerify(cookieValue, secretKey, {
         algorithms: ["HS256"],
       });
@@ -256,14 +288,18 @@ class SDKServer {
     } as GetUserInfoWithJwtResponse;
   }
 
-  async authenticateRequest(req: Request): Promise<User> {
+  /**
+   * Resolve the signed-in user for a request, or null when there is no valid
+   * session. Anonymous traffic is the common case, so it is reported as a
+   * plain return value rather than a thrown and discarded error.
+   */
+  async tryAuthenticateRequest(req: Request): Promise<User | null> {
     // Regular authentication flow
-    const cookies = this.parseCookies(req.headers.cookie);
-    const sessionCookie = cookies.get(COOKIE_NAME);
+    const sessionCookie = this.readSessionCookie(req.headers.cookie);
     const session = await this.verifySession(sessionCookie);
 
     if (!session) {
-      throw ForbiddenError("Invalid session cookie");
+      return null;
     }
 
     const sessionUserId = session.openId;
@@ -284,21 +320,34 @@ class SDKServer {
         user = await db.getUserByOpenId(userInfo.openId);
       } catch (error) {
         console.error("[Auth] Failed to sync user from OAuth:", error);
-        throw ForbiddenError("Failed to sync user info");
+        return null;
       }
     }
 
     if (!user) {
-      throw ForbiddenError("User not found");
+      return null;
     }
 
-    await db.upsertUser({
-      openId: user.openId,
-      lastSignedIn: signedInAt,
-    });
+    // lastSignedIn is activity bookkeeping; refreshing it on every request
+    // turned each authenticated read into a DB write
+    const lastSignedIn = user.lastSignedIn.getTime();
+    if (signedInAt.getTime() - lastSignedIn >= LAST_SIGNED_IN_REFRESH_MS) {
+      await db.upsertUser({
+        openId: user.openId,
+        lastSignedIn: signedInAt,
+      });
+    }
 
     return user;
   }
+
+  async authenticateRequest(req: Request): Promise<User> {
+    const user = await this.tryAuthenticateRequest(req);
+    if (!user) {
+      throw ForbiddenError("Invalid session cookie");
+    }
+    return user;
+  }
 }
 
 export const sdk = new SDKServer();
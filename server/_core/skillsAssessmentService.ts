@@ -3,6 +3,8 @@
  * Integrates with third-party skills testing platforms
  */
 
+import { randomBytes } from "crypto";
+
 export interface AssessmentProvider {
   id: string;
   name: string;
@@ -91,7 +93,7 @@ export class IndeedAssessmentsService {
     assessmentId: string
   ): Promise<AssessmentInvitation> {
     // Mock implementation - in production, call Indeed API
-    const invitationLink = `https://assessments.indeed.com/invite/${Math.random().toString(36).substring(7)}`;
+    const invitationLink = `https://assessments.indeed.com/invite/${randomBytes(4).toString("hex")}`;
     const expiresAt = new Date();
     expiresAt.setDate(expiresAt.getDate() + 7); // 7 days expiry
 
@@ -162,7 +164,7 @@ export class CriteriaCorpService {
     assessmentId: string
   ): Promise<AssessmentInvitation> {
     // Mock implementation - in production, call Criteria API
-    const invitationLink = `https://app.criteriacorp.com/assessment/${Math.random().toString(36).substring(7)}`;
+    const invitationLink = `https://app.criteriacorp.com/assessment/${randomBytes(4).toString("hex")}`;
     const expiresAt = new Date();
     expiresAt.setDate(expiresAt.getDate() + 14); // 14 days expiry
 
@@ -10,11 +10,15 @@ const t = initTRPC.context<TrpcContext>().create({
 export const router = t.router;
 export const publicProcedure = t.procedure;
 
+// Rejection payloads are fixed; build them once rather than per denied call
+const UNAUTHED_ERROR = { code: "UNAUTHORIZED", message: UNAUTHED_ERR_MSG } as const;
+const NOT_ADMIN_ERROR = { code: "FORBIDDEN", message: NOT_ADMIN_ERR_MSG } as const;
+
 const requireUser = t.middleware(async opts => {
   const { ctx, next } = opts;
 
   if (!ctx.user) {
-    throw new TRPCError({ code: "UNAUTHORIZED", message: UNAUTHED_ERR_MSG });
+    throw new TRPCError(UNAUTHED_ERROR);
   }
 
   return next({
@@ -32,7 +36,7 @@ export const adminProcedure = t.procedure.use(
     const { ctx, next } = opts;
 
     if (!ctx.user || ctx.user.role !== 'admin') {
-      throw new TRPCError({ code: "FORBIDDEN", message: NOT_ADMIN_ERR_MSG });
+      throw new TRPCError(NOT_ADMIN_ERROR);
     }
 
     return next({
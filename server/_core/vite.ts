@@ -3,10 +3,12 @@ import fs from "fs";
 import { type Server } from "http";
 import { nanoid } from "nanoid";
 import path from "path";
-import { createServer as createViteServer } from "vite";
-import viteConfig from "../../vite.config";
 
 export async function setupVite(app: Express, server: Server) {
+  // Load the Vite toolchain (and the plugins pulled in by vite.config) only in
+  // development so the production server never pays for it at boot
+  const { createServer: createViteServer } = await import("vite");
+
   const serverOptions = {
     middlewareMode: true,
     hmr: { server },
@@ -14,8 +16,7 @@ export async function setupVite(app: Express, server: Server) {
   };
 
   const vite = await createViteServer({
-    ...viteConfig,
-    configFile: false,
+    configFile: path.resolve(import.meta.dirname, "../..", "vite.config.ts"),
     server: serverOptions,
     appType: "custom",
   });
@@ -47,6 +48,30 @@ export async function setupVite(app: Express, server: Server) {
   });
 }
 
+/**
+ * URL paths ("/favicon.ico", "/icons/app.png") of every file under `root`,
+ * skipping the top-level directories in `exclude`.
+ */
+function listStaticFiles(root: string, exclude: ReadonlySet<string>) {
+  const files = new Set<string>();
+  if (!fs.existsSync(root)) return files;
+
+  const walk = (dir: string, urlPrefix: string) => {
+    for (const entry of fs.readdirSync(dir, { withFileTypes: true })) {
+      const urlPath = `${urlPrefix}/${entry.name}`;
+      if (entry.isDirectory()) {
+        if (!(urlPrefix === "" && exclude.has(entry.name))) {
+          walk(path.join(dir, entry.name), urlPath);
+        }
+      } else {
+        files.add(urlPath);
+      }
+    }
+  };
+  walk(root, "");
+  return files;
+}
+
 export function serveStatic(app: Express) {
   const distPath =
     process.env.NODE_ENV === "development"
@@ -58,10 +83,45 @@ export function serveStatic(app: Express) {
     );
   }
 
-  app.use(express.static(distPath));
+  // Vite fingerprints everything under /assets, so those files can be cached
+  // by the browser for good; a missing asset is a 404, not the SPA shell
+  app.use(
+    "/assets",
+    express.static(path.join(distPath, "assets"), {
+      immutable: true,
+      maxAge: "1y",
+      index: false,
+      fallthrough: false,
+    })
+  );
+
+  // The build output is fixed for the life of the process. Index it once so
+  // client-side routes (/candidates/42, ...) skip the stat() express.static
+  // would otherwise make before falling through to the SPA shell.
+  const publicFiles = listStaticFiles(distPath, new Set(["assets"]));
+  const servePublicFile = express.static(distPath, { index: false });
+  app.use((req, res, next) => {
+    if (publicFiles.has(req.path)) {
+      servePublicFile(req, res, next);
+      return;
+    }
+    next();
+  });
+
+  // The SPA shell only changes on deploy; keep it in memory instead of
+  // stat-ing and streaming it from disk for every client-side route
+  const indexPath = path.resolve(distPath, "index.html");
+  const indexHtml = fs.existsSync(indexPath) ? fs.readFileSync(indexPath) : null;
 
   // fall through to index.html if the file doesn't exist
   app.use("*", (_req, res) => {
-    res.sendFile(path.resolve(distPath, "index.html"));
+    if (!indexHtml) {
+      res.sendFile(indexPath);
+      return;
+    }
+    res
+      .status(200)
+      .set({ "Content-Type": "text/html; charset=utf-8", "Cache-Control": "no-cache" })
+      .end(indexHtml);
   });
 }
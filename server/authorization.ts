@@ -7,6 +7,12 @@ import { TRPCError } from "@trpc/server";
 import type { User } from "../drizzle/schema";
 import { ErrorMessages } from "./errors";
 
+// Fixed rejection payload; built once like the ones in _core/trpc.ts
+const ADMIN_REQUIRED_ERROR = {
+  code: "FORBIDDEN",
+  message: ErrorMessages.AUTH.FORBIDDEN,
+} as const;
+
 /**
  * Check if user is an admin
  */
@@ -42,10 +48,7 @@ export function requireAuthorization(
  */
 export function requireAdmin(user: User): void {
   if (!isAdmin(user)) {
-    throw new TRPCError({
-      code: "FORBIDDEN",
-      message: ErrorMessages.AUTH.FORBIDDEN,
-    });
+    throw new TRPCError(ADMIN_REQUIRED_ERROR);
   }
 }
 
@@ -0,0 +1,30 @@
+/**
+ * Concurrency helpers for I/O-bound batch work
+ * Keeps several network calls (LLM, email, external APIs) in flight at once
+ * without flooding the upstream service
+ */
+
+/**
+ * Map over items with at most `limit` async calls in flight.
+ * Results are returned in the same order as the input items.
+ */
+export async function mapWithConcurrency<T, R>(
+  items: readonly T[],
+  limit: number,
+  fn: (item: T, index: number) => Promise<R>
+): Promise<R[]> {
+  const results = new Array<R>(items.length);
+  let nextIndex = 0;
+
+  const worker = async () => {
+    while (nextIndex < items.length) {
+      const index = nextIndex++;
+      results[index] = await fn(items[index], index);
+    }
+  };
+
+  const workerCount = Math.max(1, Math.min(limit, items.length));
+  await Promise.all(Array.from({ length: workerCount }, worker));
+
+  return results;
+}
@@ -1,4 +1,5 @@
-import { eq, and, desc, sql } from "drizzle-orm";
+import { createHash, randomBytes } from "crypto";
+import { eq, and, desc, sql, count, inArray, getTableColumns } from "drizzle-orm";
 import { drizzle } from "drizzle-orm/mysql2";
 import { 
   InsertUser, 
@@ -53,7 +54,11 @@ import {
   assessmentInvitations,
   backgroundChecks,
   importHistory,
-  InsertCandidatePortalToken
+  InsertCandidatePortalToken,
+  interviewRecordings,
+  Candidate,
+  Program,
+  PipelineStage
 } from "../drizzle/schema";
 import { ENV } from './_core/env';
 
@@ -61,9 +66,23 @@ let _db: ReturnType<typeof drizzle> | null = null;
 
 // Lazily create the drizzle instance so local tooling can run without a DB.
 export async function getDb() {
-  if (!_db && process.env.DATABASE_URL) {
+  if (!_db && ENV.databaseUrl) {
     try {
-      _db = drizzle(process.env.DATABASE_URL);
+      _db = drizzle({
+        connection: {
+          uri: ENV.databaseUrl,
+          connectionLimit: ENV.dbPoolSize,
+          // Idle connections beyond maxIdle are closed after idleTimeout (a
+          // minute), so the pool recycles them rather than validating each one
+          // on checkout; database liveness is the readiness probe's job
+          maxIdle: ENV.dbPoolMaxIdle,
+          idleTimeout: 60_000,
+          // TCP keepalive stops idle NAT/load-balancer timeouts from handing
+          // queries a dead socket
+          enableKeepAlive: true,
+          keepAliveInitialDelay: 10_000,
+        },
+      });
     } catch (error) {
       console.warn("[Database] Failed to connect:", error);
       _db = null;
@@ -114,12 +133,10 @@ export async function upsertUser(user: InsertUser): Promise<void> {
       updateSet.role = 'admin';
     }
 
-    if (!values.lastSignedIn) {
-      values.lastSignedIn = new Date();
-    }
-
+    // An omitted lastSignedIn is filled in by the column default on insert
+    // and by the database clock on update, so no timestamp is sent along
     if (Object.keys(updateSet).length === 0) {
-      updateSet.lastSignedIn = new Date();
+      updateSet.lastSignedIn = sql`CURRENT_TIMESTAMP`;
     }
 
     await db.insert(users).values(values).onDuplicateKeyUpdate({
@@ -184,6 +201,18 @@ export async function createJob(job: InsertJob) {
   return Number(result.insertId);
 }
 
+/**
+ * Insert many jobs with one multi-row INSERT. Callers chunk large imports;
+ * see csvMigration.executeImport.
+ */
+export async function createJobs(rows: InsertJob[]) {
+  const db = await getDb();
+  if (!db) throw new Error("Database not available");
+  if (rows.length === 0) return;
+
+  await db.insert(jobs).values(rows);
+}
+
 export async function getJobById(id: number) {
   const db = await getDb();
   if (!db) return undefined;
@@ -206,6 +235,23 @@ export async function updateJob(id: number, updates: Partial<InsertJob>) {
   await db.update(jobs).set(updates).where(eq(jobs.id, id));
 }
 
+/**
+ * Set the status of several jobs with a single UPDATE ... WHERE id IN.
+ * Returns the ids that matched an existing job.
+ */
+export async function updateJobsStatus(ids: number[], status: InsertJob["status"]) {
+  const db = await getDb();
+  if (!db) throw new Error("Database not available");
+  if (ids.length === 0) return [];
+
+  const found = await db.select({ id: jobs.id }).from(jobs).where(inArray(jobs.id, ids));
+  const foundIds = found.map(job => job.id);
+  if (foundIds.length > 0) {
+    await db.update(jobs).set({ status }).where(inArray(jobs.id, foundIds));
+  }
+  return foundIds;
+}
+
 export async function deleteJob(id: number) {
   const db = await getDb();
   if (!db) throw new Error("Database not available");
@@ -217,8 +263,6 @@ export async function getJobStats(jobId: number) {
   const db = await getDb();
   if (!db) throw new Error("Database not available");
   
-  const { sql, count } = await import("drizzle-orm");
-  
   // Get candidates grouped by stage
   const stageStats = await db
     .select({
@@ -274,6 +318,18 @@ export async function createCandidate(candidate: InsertCandidate) {
   return Number(result.insertId);
 }
 
+/**
+ * Insert many candidates with one multi-row INSERT. Callers chunk large
+ * imports; see csvMigration.executeImport.
+ */
+export async function createCandidates(rows: InsertCandidate[]) {
+  const db = await getDb();
+  if (!db) throw new Error("Database not available");
+  if (rows.length === 0) return;
+
+  await db.insert(candidates).values(rows);
+}
+
 export async function getCandidateById(id: number) {
   const db = await getDb();
   if (!db) return undefined;
@@ -289,11 +345,27 @@ export async function getCandidatesByJob(jobId: number) {
   return db.select().from(candidates).where(eq(candidates.jobId, jobId)).orderBy(candidates.appliedAt);
 }
 
+/**
+ * Most recent application for an email address, case-insensitively: the
+ * column's collation (migration 0027) makes this a plain index lookup
+ */
+export async function getCandidateByEmail(email: string) {
+  const db = await getDb();
+  if (!db) return undefined;
+  
+  const result = await db
+    .select()
+    .from(candidates)
+    .where(eq(candidates.email, email))
+    .orderBy(desc(candidates.appliedAt))
+    .limit(1);
+  return result[0];
+}
+
 export async function getCandidateByEmailAndJob(email: string, jobId: number) {
   const db = await getDb();
   if (!db) return undefined;
   
-  const { and } = await import("drizzle-orm");
   const result = await db
     .select()
     .from(candidates)
@@ -536,6 +608,22 @@ export async function updateDocumentStatus(id: number, status: "pending" | "appr
   return updated[0];
 }
 
+/**
+ * Review several documents with a single UPDATE ... WHERE id IN
+ */
+export async function updateDocumentsStatus(ids: number[], status: "pending" | "approved" | "rejected", reviewedBy: number, notes?: string) {
+  const db = await getDb();
+  if (!db) throw new Error("Database not available");
+  if (ids.length === 0) return;
+
+  await db.update(documents).set({
+    status,
+    reviewedBy,
+    reviewedAt: sql`CURRENT_TIMESTAMP`,
+    notes,
+  }).where(inArray(documents.id, ids));
+}
+
 // ========================================
 // Participant Progress Management
 // ========================================
@@ -554,7 +642,6 @@ export async function getParticipantProgress(candidateId: number, programId: num
   const db = await getDb();
   if (!db) return undefined;
   
-  const { and } = await import("drizzle-orm");
   const result = await db.select().from(participantProgress)
     .where(and(
       eq(participantProgress.candidateId, candidateId),
@@ -585,6 +672,13 @@ export async function getDocumentById(id: number) {
   return result.length > 0 ? result[0] : undefined;
 }
 
+export async function getDocumentsByIds(ids: number[]) {
+  const db = await getDb();
+  if (!db || ids.length === 0) return [];
+
+  return await db.select().from(documents).where(inArray(documents.id, ids));
+}
+
 export async function getDocumentsByCandidate(candidateId: number) {
   const db = await getDb();
   if (!db) return [];
@@ -645,6 +739,24 @@ export async function getAllParticipants() {
   return await db.select().from(participantProgress);
 }
 
+/**
+ * Program enrollments of the candidate records matching an email, each
+ * paired with its candidate in a single join. candidates.email compares
+ * case-insensitively.
+ */
+export async function getParticipantsByCandidateEmail(email: string) {
+  const db = await getDb();
+  if (!db) return [];
+
+  return await db.select({
+    participant: participantProgress,
+    candidate: { id: candidates.id, name: candidates.name, email: candidates.email },
+  })
+    .from(participantProgress)
+    .innerJoin(candidates, eq(participantProgress.candidateId, candidates.id))
+    .where(eq(candidates.email, email));
+}
+
 export async function getStagesByProgramId(programId: number) {
   const db = await getDb();
   if (!db) return [];
@@ -654,6 +766,56 @@ export async function getStagesByProgramId(programId: number) {
     .orderBy(pipelineStages.order);
 }
 
+// Batch loaders for reports over many participants: one IN query per related
+// table, in place of a lookup per participant per relation
+
+export async function getCandidatesByIds(ids: number[]) {
+  const byId = new Map<number, Candidate>();
+  const db = await getDb();
+  if (!db || ids.length === 0) return byId;
+
+  const rows = await db.select().from(candidates).where(inArray(candidates.id, ids));
+  for (const candidate of rows) {
+    byId.set(candidate.id, candidate);
+  }
+  return byId;
+}
+
+export async function getProgramsByIds(ids: number[]) {
+  const byId = new Map<number, Program>();
+  const db = await getDb();
+  if (!db || ids.length === 0) return byId;
+
+  const rows = await db.select().from(programs).where(inArray(programs.id, ids));
+  for (const program of rows) {
+    byId.set(program.id, program);
+  }
+  return byId;
+}
+
+/**
+ * Stages for several programs, grouped by program id and ordered as
+ * getStagesByProgramId orders them
+ */
+export async function getStagesByProgramIds(programIds: number[]) {
+  const byProgram = new Map<number, PipelineStage[]>();
+  const db = await getDb();
+  if (!db || programIds.length === 0) return byProgram;
+
+  const rows = await db.select().from(pipelineStages)
+    .where(inArray(pipelineStages.programId, programIds))
+    .orderBy(pipelineStages.order);
+  for (const stage of rows) {
+    const stages = byProgram.get(stage.programId);
+    if (stages) {
+      stages.push(stage);
+    } else {
+      byProgram.set(stage.programId, [stage]);
+    }
+  }
+  return byProgram;
+}
+
 export async function getParticipantById(id: number) {
   const db = await getDb();
   if (!db) return undefined;
@@ -709,6 +871,35 @@ export async function getPendingDocuments() {
     .where(eq(documents.status, "pending"));
 }
 
+export async function countPendingDocuments() {
+  const db = await getDb();
+  if (!db) return 0;
+
+  const [row] = await db.select({ total: count() }).from(documents)
+    .where(eq(documents.status, "pending"));
+  return row?.total ?? 0;
+}
+
+/**
+ * Newest pending documents with the uploading candidate's name, fetched in
+ * one joined query instead of a candidate lookup per document
+ */
+export async function getRecentPendingDocuments(limit: number) {
+  const db = await getDb();
+  if (!db) return [];
+
+  return await db.select({
+    name: documents.name,
+    candidateName: candidates.name,
+    uploadedAt: documents.createdAt,
+  })
+    .from(documents)
+    .leftJoin(candidates, eq(documents.candidateId, candidates.id))
+    .where(eq(documents.status, "pending"))
+    .orderBy(desc(documents.createdAt))
+    .limit(limit);
+}
+
 export async function getParticipantsByProgramId(programId: number) {
   const db = await getDb();
   if (!db) return [];
@@ -731,6 +922,15 @@ export async function getAllUsers() {
   return await db.select().from(users);
 }
 
+export async function getAdminContacts() {
+  const db = await getDb();
+  if (!db) return [];
+
+  return await db.select({ id: users.id, name: users.name, email: users.email })
+    .from(users)
+    .where(eq(users.role, "admin"));
+}
+
 export async function getRequirementsByStageId(stageId: number) {
   const db = await getDb();
   if (!db) return [];
@@ -1119,6 +1319,29 @@ export async function getAllCandidates() {
   return database.select().from(candidates);
 }
 
+// Every candidate column except the large free-text ones (parsed resume,
+// cover letter), which lists, search and stats never read
+const { resumeText: _resumeText, coverLetter: _coverLetter, ...candidateSummaryColumns } =
+  getTableColumns(candidates);
+
+/**
+ * getAllCandidates without resumeText and coverLetter: those can run to tens
+ * of kilobytes a row and dominate what a full-table read moves
+ */
+export async function getAllCandidateSummaries() {
+  const database = await getDb();
+  if (!database) return [];
+  return database.select(candidateSummaryColumns).from(candidates);
+}
+
+export async function getCandidateSummariesByJob(jobId: number) {
+  const database = await getDb();
+  if (!database) return [];
+  return database.select(candidateSummaryColumns).from(candidates)
+    .where(eq(candidates.jobId, jobId))
+    .orderBy(candidates.appliedAt);
+}
+
 export async function getAllJobs() {
   const database = await getDb();
   if (!database) return [];
@@ -1208,9 +1431,10 @@ export async function createAuditLog(data: {
     action: data.action,
     tableName: data.tableName,
     recordId: data.recordId,
-    beforeSnapshot: data.beforeSnapshot ? JSON.stringify(data.beforeSnapshot) : null,
-    afterSnapshot: data.afterSnapshot ? JSON.stringify(data.afterSnapshot) : null,
-    changes: data.changes ? JSON.stringify(data.changes) : null,
+    // JSON columns: the driver encodes these, so they're passed as objects
+    beforeSnapshot: data.beforeSnapshot ?? null,
+    afterSnapshot: data.afterSnapshot ?? null,
+    changes: data.changes ?? null,
     ipAddress: data.ipAddress,
     userAgent: data.userAgent,
   });
@@ -1218,6 +1442,16 @@ export async function createAuditLog(data: {
   return result;
 }
 
+// The audit feed lists hundreds of entries at a time; the before/after
+// snapshots are full row copies that only the detail view reads
+const {
+  beforeSnapshot: _beforeSnapshot,
+  afterSnapshot: _afterSnapshot,
+  changes: _changes,
+  userAgent: _userAgent,
+  ...auditLogSummaryColumns
+} = getTableColumns(auditLog);
+
 export async function getAuditLogs(filters: {
   userId?: number;
   tableName?: string;
@@ -1228,25 +1462,42 @@ export async function getAuditLogs(filters: {
   const db = await getDb();
   if (!db) throw new Error("Database not initialized");
 
-  let query = db.select().from(auditLog);
-
+  // Filters combine into one WHERE (chained .where() calls replace each
+  // other), so the (userId, createdAt) and (tableName, recordId, createdAt)
+  // indexes can serve both the filter and the ORDER BY
+  const conditions = [];
   if (filters.userId) {
-    query = query.where(eq(auditLog.userId, filters.userId)) as any;
+    conditions.push(eq(auditLog.userId, filters.userId));
   }
   if (filters.tableName) {
-     query = query.where(eq(auditLog.tableName, filters.tableName)) as any;
+    conditions.push(eq(auditLog.tableName, filters.tableName));
   }
   if (filters.recordId) {
-    query = query.where(eq(auditLog.recordId, filters.recordId)) as any;
+    conditions.push(eq(auditLog.recordId, filters.recordId));
   }
   if (filters.action) {
-    query = query.where(eq(auditLog.action, filters.action)) as any;
+    conditions.push(eq(auditLog.action, filters.action));
   }
-  return query
+
+  return db
+    .select(auditLogSummaryColumns)
+    .from(auditLog)
+    .where(and(...conditions))
     .orderBy(desc(auditLog.createdAt))
     .limit(filters.limit || 500);
 }
 
+/**
+ * A single audit entry with its snapshots and field changes
+ */
+export async function getAuditLogById(id: number) {
+  const db = await getDb();
+  if (!db) throw new Error("Database not initialized");
+
+  const [entry] = await db.select().from(auditLog).where(eq(auditLog.id, id)).limit(1);
+  return entry;
+}
+
 // ============================================
 // Email Template Functions
 // ============================================
@@ -1322,6 +1573,20 @@ export async function updateEmailTemplate(id: number, data: Partial<InsertEmailT
   return result;
 }
 
+/**
+ * Unset the default flag on every email template of a type in one UPDATE,
+ * bumping each one's version as updateEmailTemplate would
+ */
+export async function clearDefaultEmailTemplates(type: InsertEmailTemplate["type"]) {
+  const db = await getDb();
+  if (!db) throw new Error("Database not initialized");
+
+  await db
+    .update(emailTemplates)
+    .set({ isDefault: 0, version: sql`${emailTemplates.version} + 1` })
+    .where(and(eq(emailTemplates.type, type), eq(emailTemplates.isDefault, 1)));
+}
+
 export async function deleteEmailTemplate(id: number) {
   const db = await getDb();
   if (!db) throw new Error("Database not initialized");
@@ -1399,6 +1664,16 @@ export async function updateSmsTemplate(id: number, data: Partial<InsertSmsTempl
   return result;
 }
 
+export async function clearDefaultSmsTemplates(type: InsertSmsTemplate["type"]) {
+  const db = await getDb();
+  if (!db) throw new Error("Database not initialized");
+
+  await db
+    .update(smsTemplates)
+    .set({ isDefault: 0 })
+    .where(and(eq(smsTemplates.type, type), eq(smsTemplates.isDefault, 1)));
+}
+
 export async function deleteSmsTemplate(id: number) {
   const dbInstance = await getDb();
   if (!dbInstance) throw new Error("Database not initialized");
@@ -1462,7 +1737,6 @@ export async function saveDashboardLayout(data: {
         layoutData: data.layoutData,
         widgetVisibility: data.widgetVisibility,
         dateRangePreset: data.dateRangePreset,
-        updatedAt: new Date(),
       })
       .where(eq(dashboardLayouts.userId, data.userId));
   } else {
@@ -1481,14 +1755,18 @@ export async function saveDashboardLayout(data: {
  * Candidate Portal Token Functions
  */
 
+// Must match the backfill in the portal token prefix migration:
+// CONV(LEFT(SHA2(token, 256), 16), 16, 10)
+export function portalTokenPrefix(token: string) {
+  return createHash("sha256").update(token).digest().readBigUInt64BE(0);
+}
+
 export async function createCandidatePortalToken(candidateId: number): Promise<string> {
   const db = await getDb();
   if (!db) throw new Error("Database connection failed");
   
-  // Generate random token
-  const token = Array.from({ length: 32 }, () => 
-    Math.random().toString(36).charAt(2)
-  ).join('');
+  // 128 bits from the CSPRNG in one call, as 32 hex chars
+  const token = randomBytes(16).toString("hex");
   
   // Token expires in 7 days
   const expiresAt = new Date();
@@ -1497,6 +1775,7 @@ export async function createCandidatePortalToken(candidateId: number): Promise<s
   await db.insert(candidatePortalTokens).values({
     candidateId,
     token,
+    tokenPrefix: portalTokenPrefix(token),
     expiresAt,
   });
   
@@ -1510,7 +1789,10 @@ export async function validateCandidatePortalToken(token: string) {
   const [tokenRecord] = await db
     .select()
     .from(candidatePortalTokens)
-    .where(eq(candidatePortalTokens.token, token))
+    .where(and(
+      eq(candidatePortalTokens.tokenPrefix, portalTokenPrefix(token)),
+      eq(candidatePortalTokens.token, token)
+    ))
     .limit(1);
   
   if (!tokenRecord) return null;
@@ -1657,3 +1939,26 @@ export async function updateAssessmentResults(
     })
     .where(eq(assessmentInvitations.id, invitationId));
 }
+
+// ============================================
+// Interview Recordings
+// ============================================
+
+export async function getInterviewRecordingByInterviewId(interviewId: string) {
+  const db = await getDb();
+  if (!db) return undefined;
+
+  const [recording] = await db.select().from(interviewRecordings)
+    .where(eq(interviewRecordings.interviewId, interviewId))
+    .limit(1);
+  return recording;
+}
+
+export async function getRecentInterviewRecordings(limit: number) {
+  const db = await getDb();
+  if (!db) return [];
+
+  return await db.select().from(interviewRecordings)
+    .orderBy(desc(interviewRecordings.createdAt))
+    .limit(limit);
+}
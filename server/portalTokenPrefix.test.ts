@@ -0,0 +1,23 @@
+import { createHash } from "crypto";
+import { describe, expect, it } from "vitest";
+import { portalTokenPrefix } from "./db";
+
+// What the migration's backfill stores: CONV(LEFT(SHA2(token, 256), 16), 16, 10)
+function mysqlTokenPrefix(token: string) {
+  const hex = createHash("sha256").update(token).digest("hex");
+  return BigInt(`0x${hex.slice(0, 16)}`);
+}
+
+describe("portalTokenPrefix", () => {
+  it("should match the SQL backfill expression", () => {
+    for (const token of ["abc", "a".repeat(64), "f3b1c2d4e5a6978812345678abcdef00"]) {
+      expect(portalTokenPrefix(token)).toBe(mysqlTokenPrefix(token));
+    }
+  });
+
+  it("should read the prefix as an unsigned 64-bit integer", () => {
+    // SHA-256("abc") starts ba7816bf8f01cfea; the top bit is set, so a signed
+    // read would come out negative and never match the unsigned column
+    expect(portalTokenPrefix("abc")).toBe(BigInt("13436514500253700074"));
+  });
+});
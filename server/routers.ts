@@ -1,6 +1,7 @@
 import { COOKIE_NAME } from "@shared/const";
 import { getSessionCookieOptions } from "./_core/cookies";
 import { systemRouter } from "./_core/systemRouter";
+import { lazy } from "@trpc/server";
 import { publicProcedure, router } from "./_core/trpc";
 import { documentsRouter } from "./routers/documentsRouter";
 import { jobsRouter } from "./routers/jobsRouter";
@@ -15,7 +16,6 @@ import { participantPortalRouter } from "./routers/participantPortalRouter";
 import { smsRouter } from "./routers/smsRouter";
 import { templatesRouter } from "./routers/templatesRouter";
 import { analyticsRouter } from "./routers/analyticsRouter";
-import { calendarRouter } from "./routers/calendarRouter";
 import { ocrRouter } from "./routers/ocrRouter";
 import { videoTutorialsRouter } from "./routers/videoTutorialsRouter";
 import { referenceChecksRouter } from "./routers/referenceChecksRouter";
@@ -33,18 +33,16 @@ import { candidatePortalRouter } from "./routers/candidatePortalRouter";
 import { documentAutoReviewRouter } from "./routers/documentAutoReviewRouter";
 import { employerPortalRouter } from "./routers/employerPortalRouter";
 import { advancedAnalyticsRouter } from "./routers/advancedAnalyticsRouter";
-import { smsNotificationsRouter } from "./routers/smsNotificationsRouter";
-import { bulkOperationsRouter } from "./routers/bulkOperationsRouter";
-import { reportingRouter } from "./routers/reportingRouter";
 import { skillsAssessmentRouter } from "./routers/skillsAssessmentRouter";
 import { backgroundCheckRouter } from "./routers/backgroundCheckRouter";
-import { csvMigrationRouter } from "./routers/csvMigrationRouter";
 import { skillsGapRouter } from "./routers/skillsGapRouter";
 import { emailCampaignsRouter } from "./routers/emailCampaignsRouter";
 import { performanceReviewsRouter } from "./routers/performanceReviewsRouter";
 import { jobBoardRouter } from "./routers/jobBoardRouter";
 import { referralsRouter } from "./routers/referralsRouter";
 
+// Routers that pull in heavy SDKs (googleapis, twilio, jspdf/xlsx, papaparse)
+// are loaded on first use so they stay off the startup path.
 export const appRouter = router({
     // if you need to use socket.io, read and register route in server/_core/index.ts, all api should start with '/api/' so that the gateway can route correctly
   system: systemRouter,
@@ -73,7 +71,7 @@ export const appRouter = router({
   sms: smsRouter,
   templates: templatesRouter,
   analytics: analyticsRouter,
-  calendar: calendarRouter,
+  calendar: lazy(() => import("./routers/calendarRouter").then(m => m.calendarRouter)),
   ocr: ocrRouter,
   videoTutorials: videoTutorialsRouter,
   referenceChecks: referenceChecksRouter,
@@ -91,12 +89,12 @@ export const appRouter = router({
   documentAutoReview: documentAutoReviewRouter,
   employerPortal: employerPortalRouter,
   advancedAnalytics: advancedAnalyticsRouter,
-  smsNotifications: smsNotificationsRouter,
-  bulkOperations: bulkOperationsRouter,
-  reporting: reportingRouter,
+  smsNotifications: lazy(() => import("./routers/smsNotificationsRouter").then(m => m.smsNotificationsRouter)),
+  bulkOperations: lazy(() => import("./routers/bulkOperationsRouter").then(m => m.bulkOperationsRouter)),
+  reporting: lazy(() => import("./routers/reportingRouter").then(m => m.reportingRouter)),
   skillsAssessment: skillsAssessmentRouter,
   backgroundCheck: backgroundCheckRouter,
-  csvMigration: csvMigrationRouter,
+  csvMigration: lazy(() => import("./routers/csvMigrationRouter").then(m => m.csvMigrationRouter)),
   skillsGap: skillsGapRouter,
     emailCampaigns: emailCampaignsRouter,
   performanceReviews: performanceReviewsRouter,
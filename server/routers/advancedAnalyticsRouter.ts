@@ -31,6 +31,34 @@ interface RetentionMetrics {
   retentionRate90: number;
 }
 
+interface MonthTally {
+  total: number;
+  hired: number;
+}
+
+/**
+ * Bucket candidates by the YYYY-MM they were created in. Each createdAt is
+ * formatted once here, instead of once per cohort or month being compared.
+ */
+function tallyCandidatesByMonth(
+  candidates: Awaited<ReturnType<typeof db.getAllCandidateSummaries>>
+): Map<string, MonthTally> {
+  const tallies = new Map<string, MonthTally>();
+  for (const c of candidates) {
+    const month = new Date(c.createdAt).toISOString().slice(0, 7);
+    let tally = tallies.get(month);
+    if (!tally) {
+      tally = { total: 0, hired: 0 };
+      tallies.set(month, tally);
+    }
+    tally.total++;
+    if ((c as any).stage === "hired") {
+      tally.hired++;
+    }
+  }
+  return tallies;
+}
+
 export const advancedAnalyticsRouter = router({
   /**
    * Get cohort analysis data
@@ -45,22 +73,23 @@ export const advancedAnalyticsRouter = router({
     )
     .query(async ({ input }) => {
       const allProgress = await db.getAllParticipantProgress();
-      const allCandidates = await db.getAllCandidates();
+      const allCandidates = await db.getAllCandidateSummaries();
       
       // Group by month as cohorts
       const cohortMap = new Map<string, CohortData>();
       
       for (const progress of allProgress) {
-        const cohortKey = new Date(progress.startedAt).toISOString().slice(0, 7); // YYYY-MM
+        const startedAt = new Date(progress.startedAt);
+        const cohortKey = startedAt.toISOString().slice(0, 7); // YYYY-MM
         
         if (!cohortMap.has(cohortKey)) {
           cohortMap.set(cohortKey, {
             cohortId: cohortKey,
-            cohortName: new Date(progress.startedAt).toLocaleDateString("en-US", {
+            cohortName: startedAt.toLocaleDateString("en-US", {
               year: "numeric",
               month: "long",
             }),
-            startDate: new Date(progress.startedAt),
+            startDate: startedAt,
             totalCandidates: 0,
             completedCandidates: 0,
             withdrawnCandidates: 0,
@@ -78,8 +107,7 @@ export const advancedAnalyticsRouter = router({
           cohort.completedCandidates++;
           if (progress.completedAt) {
             const completionTime =
-              (new Date(progress.completedAt).getTime() -
-                new Date(progress.startedAt).getTime()) /
+              (new Date(progress.completedAt).getTime() - startedAt.getTime()) /
               (1000 * 60 * 60 * 24);
             cohort.avgCompletionTime += completionTime;
           }
@@ -90,6 +118,8 @@ export const advancedAnalyticsRouter = router({
         }
       }
       
+      const candidatesByMonth = tallyCandidatesByMonth(allCandidates);
+      
       // Calculate averages and rates
       const cohorts = Array.from(cohortMap.values()).map((cohort) => {
         if (cohort.completedCandidates > 0) {
@@ -101,17 +131,10 @@ export const advancedAnalyticsRouter = router({
             : 0;
         
         // Calculate placement rate (candidates who got hired)
-        const cohortCandidates = allCandidates.filter((c) => {
-          const createdMonth = new Date(c.createdAt).toISOString().slice(0, 7);
-          return createdMonth === cohort.cohortId;
-        });
-        const placedCandidates = cohortCandidates.filter(
-          (c) => (c as any).stage === "hired"
-        ).length;
-        cohort.placementRate =
-          cohortCandidates.length > 0
-            ? (placedCandidates / cohortCandidates.length) * 100
-            : 0;
+        const cohortCandidates = candidatesByMonth.get(cohort.cohortId);
+        cohort.placementRate = cohortCandidates
+          ? (cohortCandidates.hired / cohortCandidates.total) * 100
+          : 0;
         
         return cohort;
       });
@@ -197,7 +220,7 @@ export const advancedAnalyticsRouter = router({
   getProgramEffectiveness: protectedProcedure.query(async () => {
     const allPrograms = await db.getAllPrograms();
     const allProgress = await db.getAllParticipantProgress();
-    const allCandidates = await db.getAllCandidates();
+    const allCandidates = await db.getAllCandidateSummaries();
     
     const programMetrics = allPrograms.map((program) => {
       const programProgress = allProgress.filter(
@@ -261,7 +284,8 @@ export const advancedAnalyticsRouter = router({
       })
     )
     .query(async ({ input }) => {
-      const allCandidates = await db.getAllCandidates();
+      const allCandidates = await db.getAllCandidateSummaries();
+      const candidatesByMonth = tallyCandidatesByMonth(allCandidates);
       const now = new Date();
       const trends = [];
       
@@ -273,15 +297,9 @@ export const advancedAnalyticsRouter = router({
           month: "short",
         });
         
-        const monthCandidates = allCandidates.filter((c) => {
-          const candidateMonth = new Date(c.createdAt).toISOString().slice(0, 7);
-          return candidateMonth === monthKey;
-        });
-        
-        const totalCandidates = monthCandidates.length;
-        const hiredCandidates = monthCandidates.filter(
-          (c) => (c as any).stage === "hired"
-        ).length;
+        const monthCandidates = candidatesByMonth.get(monthKey);
+        const totalCandidates = monthCandidates?.total ?? 0;
+        const hiredCandidates = monthCandidates?.hired ?? 0;
         const successRate =
           totalCandidates > 0 ? (hiredCandidates / totalCandidates) * 100 : 0;
         
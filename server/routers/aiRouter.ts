@@ -1,11 +1,31 @@
 import { z } from "zod";
 import { protectedProcedure, router } from "../_core/trpc";
-import { invokeLLM } from "../_core/llm";
+import { invokeLLM, invokeLLMCached, type InvokeResult } from "../_core/llm";
 import * as db from "../db";
 import { TRPCError } from "@trpc/server";
 import { ErrorMessages } from "../errors";
 import { requireAuthorization } from "../authorization";
 import { sanitizeRichText, validateId } from "../validation";
+import { mapWithConcurrency } from "../concurrency";
+import { ENV } from "../_core/env";
+
+// Parsers for cached LLM calls: they throw on a malformed response so it is
+// dropped from the cache instead of being served again
+function requireTextContent(response: InvokeResult): string {
+  const content = response.choices[0]?.message?.content;
+  if (typeof content !== "string" || !content) {
+    throw new Error("No response from LLM");
+  }
+  return content;
+}
+
+function parseAssessment(response: InvokeResult) {
+  const assessment = JSON.parse(requireTextContent(response));
+  if (typeof assessment?.matchScore !== "number") {
+    throw new Error("LLM assessment is missing a match score");
+  }
+  return assessment;
+}
 
 /**
  * AI-powered features router
@@ -168,7 +188,7 @@ Provide your assessment in JSON format:
   "concerns": ["<concern 1>", "<concern 2>"]
 }`;
 
-        const response = await invokeLLM({
+        const assessment = await invokeLLMCached({
           messages: [
             { role: "system", content: systemPrompt },
             { role: "user", content: userPrompt },
@@ -205,11 +225,7 @@ Provide your assessment in JSON format:
               },
             },
           },
-        });
-
-        const content = response.choices[0]?.message?.content;
-        const contentStr = typeof content === 'string' ? content : '{}';
-        const assessment = JSON.parse(contentStr);
+        }, parseAssessment);
 
         // Update candidate with match score
         await db.updateCandidate(input.candidateId, {
@@ -249,34 +265,35 @@ Provide your assessment in JSON format:
 
         const candidates = await db.getCandidatesByJob(input.jobId);
 
-        // Process candidates in batches to avoid rate limits
-        const results = [];
-        for (const candidate of candidates) {
-          try {
-            // Skip if already has a match score
-            if (candidate.matchScore !== null) {
-              results.push({
-                candidateId: candidate.id,
-                matchScore: candidate.matchScore,
-                skipped: true,
-              });
-              continue;
-            }
-
-            // Calculate match score
-            if (!candidate.resumeText && !candidate.coverLetter) {
-              await db.updateCandidate(candidate.id, { matchScore: 30 });
-              results.push({
-                candidateId: candidate.id,
-                matchScore: 30,
-                skipped: false,
-              });
-              continue;
-            }
-
-            const systemPrompt = `You are an expert recruiter. Analyze this candidate against the job requirements and return ONLY a match score from 0-100 as a single number.`;
-
-            const userPrompt = `Job: ${job.title}
+        // Score candidates concurrently; the work is dominated by LLM round
+        // trips, so keep a bounded number in flight to respect upstream limits
+        const results = await mapWithConcurrency(
+          candidates,
+          ENV.llmConcurrency,
+          async (candidate) => {
+            try {
+              // Skip if already has a match score
+              if (candidate.matchScore !== null) {
+                return {
+                  candidateId: candidate.id,
+                  matchScore: candidate.matchScore,
+                  skipped: true,
+                };
+              }
+
+              // Calculate match score
+              if (!candidate.resumeText && !candidate.coverLetter) {
+                await db.updateCandidate(candidate.id, { matchScore: 30 });
+                return {
+                  candidateId: candidate.id,
+                  matchScore: 30,
+                  skipped: false,
+                };
+              }
+
+              const systemPrompt = `You are an expert recruiter. Analyze this candidate against the job requirements and return ONLY a match score from 0-100 as a single number.`;
+
+              const userPrompt = `Job: ${job.title}
 Requirements: ${job.description}
 
 Candidate: ${candidate.name}
@@ -284,33 +301,34 @@ ${candidate.resumeText || candidate.coverLetter || "No details provided"}
 
 Return only the match score number (0-100):`;
 
-            const response = await invokeLLM({
-              messages: [
-                { role: "system", content: systemPrompt },
-                { role: "user", content: userPrompt },
-              ],
-            });
-
-            const scoreText = response.choices[0]?.message?.content;
-            const scoreStr = typeof scoreText === 'string' ? scoreText : '50';
-            const matchScore = Math.min(100, Math.max(0, parseInt(scoreStr.replace(/\D/g, "")) || 50));
-
-            await db.updateCandidate(candidate.id, { matchScore });
-
-            results.push({
-              candidateId: candidate.id,
-              matchScore,
-              skipped: false,
-            });
-          } catch (error) {
-            console.error(`Error processing candidate ${candidate.id}:`, error);
-            results.push({
-              candidateId: candidate.id,
-              error: "Failed to calculate score",
-              skipped: false,
-            });
+              const response = await invokeLLM({
+                messages: [
+                  { role: "system", content: systemPrompt },
+                  { role: "user", content: userPrompt },
+                ],
+              });
+
+              const scoreText = response.choices[0]?.message?.content;
+              const scoreStr = typeof scoreText === 'string' ? scoreText : '50';
+              const matchScore = Math.min(100, Math.max(0, parseInt(scoreStr.replace(/\D/g, "")) || 50));
+
+              await db.updateCandidate(candidate.id, { matchScore });
+
+              return {
+                candidateId: candidate.id,
+                matchScore,
+                skipped: false,
+              };
+            } catch (error) {
+              console.error(`Error processing candidate ${candidate.id}:`, error);
+              return {
+                candidateId: candidate.id,
+                error: "Failed to calculate score",
+                skipped: false,
+              };
+            }
           }
-        }
+        );
 
         return {
           success: true,
@@ -371,14 +389,12 @@ Provide:
 
 Keep it brief and actionable.`;
 
-        const response = await invokeLLM({
+        const insights = await invokeLLMCached({
           messages: [
             { role: "system", content: systemPrompt },
             { role: "user", content: userPrompt },
           ],
-        });
-
-        const insights = response.choices[0]?.message?.content || "";
+        }, requireTextContent);
 
         return {
           insights,
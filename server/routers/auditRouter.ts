@@ -25,4 +25,21 @@ export const auditRouter = router({
 
       return db.getAuditLogs(input);
     }),
+
+  /**
+   * Get one audit log entry with its snapshots and changes
+   */
+  getAuditLogDetail: protectedProcedure
+    .input(z.object({ id: z.number() }))
+    .query(async ({ input, ctx }) => {
+      if (ctx.user.role !== "admin") {
+        throw new TRPCError({ code: "FORBIDDEN", message: "Admin access required" });
+      }
+
+      const entry = await db.getAuditLogById(input.id);
+      if (!entry) {
+        throw new TRPCError({ code: "NOT_FOUND", message: "Audit log entry not found" });
+      }
+      return entry;
+    }),
 });
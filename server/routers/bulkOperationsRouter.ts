@@ -175,49 +175,60 @@ export const bulkOperationsRouter = router({
         sendNotification: z.boolean().optional(),
       })
     )
-    .mutation(async ({ input }) => {
+    .mutation(async ({ input, ctx }) => {
       const results = {
         success: 0,
         failed: 0,
         errors: [] as string[],
       };
 
+      // One read and one UPDATE ... WHERE id IN for the whole selection
+      const documents = await db.getDocumentsByIds(input.documentIds);
+      const foundIds = new Set(documents.map((document) => document.id));
       for (const documentId of input.documentIds) {
-        try {
-          const document = await db.getDocumentById(documentId);
-          if (!document) {
-            results.failed++;
-            results.errors.push(`Document ${documentId} not found`);
-            continue;
-          }
+        if (!foundIds.has(documentId)) {
+          results.failed++;
+          results.errors.push(`Document ${documentId} not found`);
+        }
+      }
 
-          await db.updateDocumentStatus(documentId, "approved");
+      try {
+        await db.updateDocumentsStatus(Array.from(foundIds), "approved", ctx.user.id);
+      } catch (error) {
+        results.failed += documents.length;
+        results.errors.push(
+          `Failed to approve documents: ${error instanceof Error ? error.message : "Unknown error"}`
+        );
+        return results;
+      }
+
+      const candidates = await db.getCandidatesByIds(
+        input.sendNotification ? documents.map((document) => document.candidateId) : []
+      );
 
+      for (const document of documents) {
+        try {
           // Send notification if requested
-          if (input.sendNotification && document.candidateId) {
-            const candidate = await db.getCandidateById(document.candidateId);
-            if (candidate?.email) {
-              await sendEmail({
-                to: candidate.email,
-                subject: "Document Approved",
-                html: `
-                  <h2>Document Approved</h2>
-                  <p>Hi ${candidate.name},</p>
-                  <p>Your document <strong>${document.name}</strong> has been approved.</p>
-                  <p>You can view your application status in the candidate portal.</p>
-                  <p>Best regards,<br>HR Team</p>
-                `,
-              });
-            }
+          const candidate = candidates.get(document.candidateId);
+          if (candidate?.email) {
+            await sendEmail({
+              to: candidate.email,
+              subject: "Document Approved",
+              html: `
+                <h2>Document Approved</h2>
+                <p>Hi ${candidate.name},</p>
+                <p>Your document <strong>${document.name}</strong> has been approved.</p>
+                <p>You can view your application status in the candidate portal.</p>
+                <p>Best regards,<br>HR Team</p>
+              `,
+            });
           }
-
-          results.success++;
         } catch (error) {
-          results.failed++;
           results.errors.push(
-            `Failed to approve document ${documentId}: ${error instanceof Error ? error.message : "Unknown error"}`
+            `Approved document ${document.id} but failed to notify: ${error instanceof Error ? error.message : "Unknown error"}`
           );
         }
+        results.success++;
       }
 
       return results;
@@ -281,23 +292,21 @@ export const bulkOperationsRouter = router({
         errors: [] as string[],
       };
 
-      for (const jobId of input.jobIds) {
-        try {
-          const job = await db.getJobById(jobId);
-          if (!job) {
+      try {
+        const closedIds = new Set(await db.updateJobsStatus(input.jobIds, "closed"));
+        for (const jobId of input.jobIds) {
+          if (closedIds.has(jobId)) {
+            results.success++;
+          } else {
             results.failed++;
             results.errors.push(`Job ${jobId} not found`);
-            continue;
           }
-
-          await db.updateJobStatus(jobId, "closed");
-          results.success++;
-        } catch (error) {
-          results.failed++;
-          results.errors.push(
-            `Failed to close job ${jobId}: ${error instanceof Error ? error.message : "Unknown error"}`
-          );
         }
+      } catch (error) {
+        results.failed += input.jobIds.length;
+        results.errors.push(
+          `Failed to close jobs: ${error instanceof Error ? error.message : "Unknown error"}`
+        );
       }
 
       return results;
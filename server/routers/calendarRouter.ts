@@ -3,6 +3,7 @@ import { protectedProcedure, router } from "../_core/trpc";
 import { TRPCError } from "@trpc/server";
 import * as db from "../db";
 import {
+  GOOGLE_CALENDAR_CREDENTIALS,
   GoogleCalendarService,
   OutlookCalendarService,
   scheduleAppointment,
@@ -21,11 +22,7 @@ export const calendarRouter = router({
       })
     )
     .mutation(async ({ ctx, input }) => {
-      const service = new GoogleCalendarService({
-        clientId: process.env.GOOGLE_CALENDAR_CLIENT_ID || "",
-        clientSecret: process.env.GOOGLE_CALENDAR_CLIENT_SECRET || "",
-        redirectUri: process.env.GOOGLE_CALENDAR_REDIRECT_URI || "",
-      });
+      const service = new GoogleCalendarService(GOOGLE_CALENDAR_CREDENTIALS);
 
       try {
         const tokens = await service.getTokensFromCode(input.authCode);
@@ -350,11 +347,7 @@ export const calendarRouter = router({
       if (provider) {
         try {
           if (provider.providerType === "google") {
-            const service = new GoogleCalendarService({
-              clientId: process.env.GOOGLE_CALENDAR_CLIENT_ID || "",
-              clientSecret: process.env.GOOGLE_CALENDAR_CLIENT_SECRET || "",
-              redirectUri: process.env.GOOGLE_CALENDAR_REDIRECT_URI || "",
-            });
+            const service = new GoogleCalendarService(GOOGLE_CALENDAR_CREDENTIALS);
             service.setCredentials(provider.accessToken, provider.refreshToken || undefined);
             await service.deleteEvent(event.externalEventId);
           } else {
@@ -1,3 +1,4 @@
+import { randomBytes } from "crypto";
 import { z } from "zod";
 import { publicProcedure, router } from "../_core/trpc";
 import * as db from "../db";
@@ -22,8 +23,7 @@ export const candidatePortalRouter = router({
     )
     .mutation(async ({ input }) => {
       // Find candidate by email
-      const candidates = await db.getAllCandidates();
-      const candidate = candidates.find((c) => c.email === input.email);
+      const candidate = await db.getCandidateByEmail(input.email);
       
       if (!candidate) {
         throw new TRPCError({
@@ -138,7 +138,7 @@ export const candidatePortalRouter = router({
       
       // Generate unique file key
       const timestamp = Date.now();
-      const randomSuffix = Math.random().toString(36).substring(7);
+      const randomSuffix = randomBytes(4).toString("hex");
       const fileKey = `candidate-${input.candidateId}/documents/${input.documentType}-${timestamp}-${randomSuffix}`;
       
       // Upload to S3
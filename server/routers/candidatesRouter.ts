@@ -1,3 +1,4 @@
+import { randomBytes } from "crypto";
 import { z } from "zod";
 import { protectedProcedure, publicProcedure, router } from "../_core/trpc";
 import * as db from "../db";
@@ -93,7 +94,7 @@ export const candidatesRouter = router({
             }
 
             // Generate secure file key with random suffix
-            const randomSuffix = Math.random().toString(36).substring(7);
+            const randomSuffix = randomBytes(4).toString("hex");
             const fileKey = `resumes/${input.jobId}/${Date.now()}-${randomSuffix}-${input.resumeFilename}`;
             const { url } = await storagePut(fileKey, buffer, mimeType);
             resumeUrl = url;
@@ -168,7 +169,7 @@ export const candidatesRouter = router({
 
         requireAuthorization(ctx.user, job.createdBy, "job");
 
-        const candidates = await db.getCandidatesByJob(input.jobId);
+        const candidates = await db.getCandidateSummariesByJob(input.jobId);
         return candidates;
       } catch (error) {
         if (error instanceof TRPCError) throw error;
@@ -9,6 +9,24 @@ import { router, protectedProcedure } from "../_core/trpc";
 import { z } from "zod";
 import * as db from "../db";
 import { TRPCError } from "@trpc/server";
+import type { ParticipantProgress } from "../../drizzle/schema";
+
+/**
+ * Candidate, program and stages for every participant in a report, fetched
+ * with one query per table
+ */
+async function loadParticipantRelations(participants: ParticipantProgress[]) {
+  const candidateIds = Array.from(new Set(participants.map(p => p.candidateId)));
+  const programIds = Array.from(new Set(participants.map(p => p.programId)));
+
+  const [candidatesById, programsById, stagesByProgram] = await Promise.all([
+    db.getCandidatesByIds(candidateIds),
+    db.getProgramsByIds(programIds),
+    db.getStagesByProgramIds(programIds),
+  ]);
+
+  return { candidatesById, programsById, stagesByProgram };
+}
 
 export const complianceRouter = router({
   /**
@@ -163,51 +181,54 @@ export const complianceRouter = router({
           });
         }
 
-        // Get detailed information for each participant
-        const participantDetails = await Promise.all(
-          filteredParticipants.map(async (participant) => {
-            const candidate = await db.getCandidateById(participant.candidateId);
-            const program = await db.getProgramById(participant.programId);
-            const stages = await db.getStagesByProgramId(participant.programId);
-            const currentStage = stages.find(s => s.id === participant.currentStageId);
-
-            // Calculate progress
-            const stageOrder = currentStage?.order || 0;
-            const progress = stages.length > 0 ? (stageOrder / stages.length) * 100 : 0;
+        // Load the related rows for all participants at once rather than
+        // three lookups per participant
+        const { candidatesById, programsById, stagesByProgram } =
+          await loadParticipantRelations(filteredParticipants);
 
-            // Calculate days in program
-            const daysInProgram = Math.floor(
-              (new Date().getTime() - new Date(participant.startedAt).getTime()) /
-                (1000 * 60 * 60 * 24)
-            );
+        // Get detailed information for each participant
+        const participantDetails = filteredParticipants.map((participant) => {
+          const candidate = candidatesById.get(participant.candidateId);
+          const program = programsById.get(participant.programId);
+          const stages = stagesByProgram.get(participant.programId) ?? [];
+          const currentStage = stages.find(s => s.id === participant.currentStageId);
+
+          // Calculate progress
+          const stageOrder = currentStage?.order || 0;
+          const progress = stages.length > 0 ? (stageOrder / stages.length) * 100 : 0;
+
+          // Calculate days in program
+          const daysInProgram = Math.floor(
+            (new Date().getTime() - new Date(participant.startedAt).getTime()) /
+              (1000 * 60 * 60 * 24)
+          );
 
-            // Calculate days in current stage
-            const daysInStage = participant.currentStageId
-              ? Math.floor(
-                  (new Date().getTime() - new Date(participant.startedAt).getTime()) /
-                    (1000 * 60 * 60 * 24)
-                )
-              : 0;
+          // Calculate days in current stage
+          const daysInStage = participant.currentStageId
+            ? Math.floor(
+                (new Date().getTime() - new Date(participant.startedAt).getTime()) /
+                  (1000 * 60 * 60 * 24)
+              )
+            : 0;
 
-            return {
-              participantId: participant.id,
-              candidateId: candidate?.id,
-              candidateName: candidate?.name || "Unknown",
-              candidateEmail: candidate?.email,
-              programId: program?.id,
-              programName: program?.name,
-              status: participant.status,
-              currentStage: currentStage?.name || "Not started",
-              progress: Math.round(progress),
-              enrolledAt: participant.startedAt,
-              completedAt: participant.completedAt,
-              daysInProgram,
-              daysInStage,
-              stageCount: stages.length,
-              completedStages: stageOrder,
-            };
-          })
-        );
+          return {
+            participantId: participant.id,
+            candidateId: candidate?.id,
+            candidateName: candidate?.name || "Unknown",
+            candidateEmail: candidate?.email,
+            programId: program?.id,
+            programName: program?.name,
+            status: participant.status,
+            currentStage: currentStage?.name || "Not started",
+            progress: Math.round(progress),
+            enrolledAt: participant.startedAt,
+            completedAt: participant.completedAt,
+            daysInProgram,
+            daysInStage,
+            stageCount: stages.length,
+            completedStages: stageOrder,
+          };
+        });
 
         return participantDetails;
       } catch (error) {
@@ -361,11 +382,14 @@ export const complianceRouter = router({
           // CSV header
           csvContent = "Participant ID,Candidate Name,Email,Program,Status,Current Stage,Progress %,Enrolled Date,Completed Date,Days in Program\n";
 
+          const { candidatesById, programsById, stagesByProgram } =
+            await loadParticipantRelations(filteredParticipants);
+
           // CSV rows
           for (const participant of filteredParticipants) {
-            const candidate = await db.getCandidateById(participant.candidateId);
-            const program = await db.getProgramById(participant.programId);
-            const stages = await db.getStagesByProgramId(participant.programId);
+            const candidate = candidatesById.get(participant.candidateId);
+            const program = programsById.get(participant.programId);
+            const stages = stagesByProgram.get(participant.programId) ?? [];
             const currentStage = stages.find(s => s.id === participant.currentStageId);
 
             const progress = currentStage && stages.length > 0
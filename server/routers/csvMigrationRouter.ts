@@ -3,6 +3,10 @@ import { router, protectedProcedure } from "../_core/trpc";
 import { CSVMigrationService, CANDIDATE_FIELDS, JOB_FIELDS } from "../_core/csvMigrationService";
 import * as db from "../db";
 
+// Rows per multi-row INSERT: large enough to amortize the round trip, small
+// enough to stay well under max_allowed_packet
+const IMPORT_BATCH_SIZE = 500;
+
 export const csvMigrationRouter = router({
   // Get available fields for mapping
   getTargetFields: protectedProcedure
@@ -60,8 +64,11 @@ export const csvMigrationRouter = router({
       let failCount = 0;
       const errors: any[] = [];
       const rollbackId = `rollback_${Date.now()}`;
+      const insertBatch = input.type === 'candidates' ? db.createCandidates : db.createJobs;
 
-      // Process each row
+      // Validate and transform every row first, then insert the valid ones
+      // in multi-row batches instead of one INSERT round trip per row
+      const pending: { row: number; values: any }[] = [];
       for (let i = 0; i < rows.length; i++) {
         const rowErrors = CSVMigrationService.validateRow(rows[i], input.mapping, targetFields, i + 1);
 
@@ -71,32 +78,37 @@ export const csvMigrationRouter = router({
           continue;
         }
 
-        try {
-          const transformed = CSVMigrationService.transformRow(rows[i], input.mapping);
+        const transformed = CSVMigrationService.transformRow(rows[i], input.mapping);
+        pending.push({
+          row: i + 1,
+          values: input.type === 'candidates'
+            ? { ...transformed, stage: transformed.stage || 'new', source: 'CSV Import' }
+            : { ...transformed, status: transformed.status || 'draft', postedBy: ctx.user.id },
+        });
+      }
 
-          if (input.type === 'candidates') {
-            await db.createCandidate({
-              ...transformed,
-              stage: transformed.stage || 'new',
-              source: 'CSV Import',
-            });
-          } else {
-            await db.createJob({
-              ...transformed,
-              status: transformed.status || 'draft',
-              postedBy: ctx.user.id,
-            });
+      for (let start = 0; start < pending.length; start += IMPORT_BATCH_SIZE) {
+        const batch = pending.slice(start, start + IMPORT_BATCH_SIZE);
+        try {
+          await insertBatch(batch.map(entry => entry.values));
+          successCount += batch.length;
+        } catch {
+          // One bad row fails the whole statement; retry this batch row by
+          // row so the good rows still land and the bad one is reported
+          for (const entry of batch) {
+            try {
+              await insertBatch([entry.values]);
+              successCount++;
+            } catch (error) {
+              errors.push({
+                row: entry.row,
+                field: 'general',
+                value: null,
+                error: error instanceof Error ? error.message : 'Unknown error',
+              });
+              failCount++;
+            }
           }
-
-          successCount++;
-        } catch (error) {
-          errors.push({
-            row: i + 1,
-            field: 'general',
-            value: null,
-            error: error instanceof Error ? error.message : 'Unknown error',
-          });
-          failCount++;
         }
       }
 
@@ -2,7 +2,7 @@ import { z } from "zod";
 import { publicProcedure, protectedProcedure, router } from "../_core/trpc";
 import { getDb } from "../db";
 import { emailCampaigns, emailCampaignSteps, emailCampaignEnrollments, emailCampaignLogs, candidates } from "../../drizzle/schema";
-import { eq, and, desc } from "drizzle-orm";
+import { eq, and, count, desc, sql } from "drizzle-orm";
 
 /**
  * Email Campaigns Router
@@ -12,32 +12,39 @@ export const emailCampaignsRouter = router({
   // List all campaigns
   list: protectedProcedure.query(async ({ ctx }) => {
     const db = await getDb();
-    const campaigns = await db
-      .select()
-      .from(emailCampaigns)
-      .orderBy(desc(emailCampaigns.createdAt));
-    
-    // Get step counts for each campaign
-    const campaignsWithSteps = await Promise.all(
-      campaigns.map(async (campaign) => {
-        const steps = await db
-          .select()
-          .from(emailCampaignSteps)
-          .where(eq(emailCampaignSteps.campaignId, campaign.id));
-        
-        const enrollments = await db
-          .select()
-          .from(emailCampaignEnrollments)
-          .where(eq(emailCampaignEnrollments.campaignId, campaign.id));
-        
-        return {
-          ...campaign,
-          stepCount: steps.length,
-          enrollmentCount: enrollments.length,
-          activeEnrollments: enrollments.filter(e => e.status === "active").length,
-        };
-      })
-    );
+    // Counts come from two grouped aggregates rather than loading every step
+    // and enrollment row of every campaign just to take their lengths
+    const [campaigns, stepCounts, enrollmentCounts] = await Promise.all([
+      db
+        .select()
+        .from(emailCampaigns)
+        .orderBy(desc(emailCampaigns.createdAt)),
+      db
+        .select({ campaignId: emailCampaignSteps.campaignId, count: count() })
+        .from(emailCampaignSteps)
+        .groupBy(emailCampaignSteps.campaignId),
+      db
+        .select({
+          campaignId: emailCampaignEnrollments.campaignId,
+          count: count(),
+          active: sql<number>`SUM(${emailCampaignEnrollments.status} = 'active')`.mapWith(Number),
+        })
+        .from(emailCampaignEnrollments)
+        .groupBy(emailCampaignEnrollments.campaignId),
+    ]);
+
+    const stepCountByCampaign = new Map(stepCounts.map(row => [row.campaignId, row.count] as const));
+    const enrollmentsByCampaign = new Map(enrollmentCounts.map(row => [row.campaignId, row] as const));
+
+    const campaignsWithSteps = campaigns.map((campaign) => {
+      const enrollments = enrollmentsByCampaign.get(campaign.id);
+      return {
+        ...campaign,
+        stepCount: stepCountByCampaign.get(campaign.id) ?? 0,
+        enrollmentCount: enrollments?.count ?? 0,
+        activeEnrollments: enrollments?.active ?? 0,
+      };
+    });
     
     return campaignsWithSteps;
   }),
@@ -91,18 +98,17 @@ export const emailCampaignsRouter = router({
       
       const campaignId = Number(campaign.insertId);
       
-      // Insert steps
-      for (let i = 0; i < input.steps.length; i++) {
-        const step = input.steps[i];
-        await db.insert(emailCampaignSteps).values({
+      // Insert all steps in one multi-row INSERT
+      await db.insert(emailCampaignSteps).values(
+        input.steps.map((step, i) => ({
           campaignId,
           stepOrder: i + 1,
           subject: step.subject,
           body: step.body,
           delayDays: step.delayDays,
           delayHours: step.delayHours,
-        });
-      }
+        }))
+      );
       
       return { id: campaignId };
     }),
@@ -180,12 +180,7 @@ export const emailTemplatesRouter = router({
       }
 
       // Clear existing default for this type
-      const allTemplates = await db.getEmailTemplates();
-      for (const t of allTemplates) {
-        if ((t as any).type === template.type && (t as any).isDefault === 1) {
-          await db.updateEmailTemplate(t.id, { isDefault: 0 });
-        }
-      }
+      await db.clearDefaultEmailTemplates(template.type);
 
       // Set new default
       await db.updateEmailTemplate(input.id, { isDefault: 1 });
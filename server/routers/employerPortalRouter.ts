@@ -31,7 +31,7 @@ export const employerPortalRouter = router({
     const employerJobs = allJobs.filter((j) => j.createdBy === ctx.user.id);
     
     // Get candidates for employer's jobs
-    const allCandidates = await db.getAllCandidates();
+    const allCandidates = await db.getAllCandidateSummaries();
     const employerCandidates = allCandidates.filter((c) =>
       employerJobs.some((j) => j.id === c.jobId)
     );
@@ -3,8 +3,6 @@ import { protectedProcedure, router } from "../_core/trpc";
 // Temporarily disabled - need to fix import paths
 // import { processInterview, analyzeInterviewTranscription } from "../services/interviewAnalysis";
 import * as db from "../db";
-import { interviewRecordings } from "../../drizzle/schema";
-import { eq } from "drizzle-orm";
 
 export const interviewAnalysisRouter = router({
   /**
@@ -47,36 +45,16 @@ export const interviewAnalysisRouter = router({
       })
     )
     .query(async ({ input }) => {
-      const recording = await db.query.interviewRecordings.findFirst({
-        where: eq(interviewRecordings.interviewId, input.interviewId),
-      });
-
-      if (!recording) {
-        return null;
-      }
-
-      return {
-        ...recording,
-        keyMoments: JSON.parse(recording.keyMoments as string),
-        strengths: JSON.parse(recording.strengths as string),
-        concerns: JSON.parse(recording.concerns as string),
-      };
+      // keyMoments, strengths and concerns are JSON columns, decoded by the
+      // driver as the row is read
+      const recording = await db.getInterviewRecordingByInterviewId(input.interviewId);
+      return recording ?? null;
     }),
 
   /**
    * List all interview recordings
    */
   listRecordings: protectedProcedure.query(async () => {
-    const recordings = await db.query.interviewRecordings.findMany({
-      orderBy: (interviewRecordings, { desc }) => [desc(interviewRecordings.createdAt)],
-      limit: 50,
-    });
-
-    return recordings.map((recording) => ({
-      ...recording,
-      keyMoments: JSON.parse(recording.keyMoments as string),
-      strengths: JSON.parse(recording.strengths as string),
-      concerns: JSON.parse(recording.concerns as string),
-    }));
+    return db.getRecentInterviewRecordings(50);
   }),
 });
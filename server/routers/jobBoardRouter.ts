@@ -2,33 +2,63 @@ import { z } from "zod";
 import { publicProcedure, protectedProcedure, router } from "../_core/trpc";
 import * as db from "../db";
 import { publicJobListings, publicApplications, jobBoardSettings, jobs } from "../../drizzle/schema";
-import { eq, and, desc } from "drizzle-orm";
+import { eq, and, count, desc, sql } from "drizzle-orm";
+
+async function loadPublishedJobs() {
+  const database = await db.getDb();
+  if (!database) return [];
+
+  // Each listing belongs to exactly one job, so join it in rather than
+  // looking the jobs up one query per listing
+  const rows = await database
+    .select({ listing: publicJobListings, job: jobs })
+    .from(publicJobListings)
+    .leftJoin(jobs, eq(jobs.id, publicJobListings.jobId))
+    .where(eq(publicJobListings.isPublished, 1))
+    .orderBy(desc(publicJobListings.publishedAt));
+
+  return rows.map(({ listing, job }) => ({
+    ...listing,
+    job,
+  }));
+}
+
+// The careers page is public and loaded far more often than jobs are
+// published, so its listing is served from memory for a short while.
+// Publishing or unpublishing drops it at once; edits to a job's own details
+// show up within the TTL.
+const PUBLISHED_JOBS_TTL_MS = 30 * 1000;
+
+let publishedJobsCache: {
+  expiresAt: number;
+  value: ReturnType<typeof loadPublishedJobs>;
+} | null = null;
+
+function getPublishedJobs() {
+  const now = performance.now();
+  if (!publishedJobsCache || publishedJobsCache.expiresAt <= now) {
+    // Cache the promise, so concurrent misses share one query
+    const value = loadPublishedJobs();
+    publishedJobsCache = { expiresAt: now + PUBLISHED_JOBS_TTL_MS, value };
+    value.catch(() => {
+      // Never serve a failed load from cache
+      if (publishedJobsCache?.value === value) {
+        publishedJobsCache = null;
+      }
+    });
+  }
+  return publishedJobsCache.value;
+}
+
+function invalidatePublishedJobs() {
+  publishedJobsCache = null;
+}
 
 export const jobBoardRouter = router({
   /**
    * List all published jobs (public endpoint)
    */
-  listPublishedJobs: publicProcedure.query(async () => {
-    const listings = await db.getDb().query.publicJobListings.findMany({
-      where: eq(publicJobListings.isPublished, 1),
-      orderBy: [desc(publicJobListings.publishedAt)],
-    });
-
-    // Get full job details for each listing
-    const jobsWithDetails = await Promise.all(
-      listings.map(async (listing) => {
-        const job = await db.getDb().query.jobs.findFirst({
-          where: eq(jobs.id, listing.jobId),
-        });
-        return {
-          ...listing,
-          job,
-        };
-      })
-    );
-
-    return jobsWithDetails;
-  }),
+  listPublishedJobs: publicProcedure.query(() => getPublishedJobs()),
 
   /**
    * Get job by slug (public endpoint)
@@ -36,28 +66,33 @@ export const jobBoardRouter = router({
   getJobBySlug: publicProcedure
     .input(z.object({ slug: z.string() }))
     .query(async ({ input }) => {
-      const listing = await db.getDb().query.publicJobListings.findFirst({
-        where: and(
-          eq(publicJobListings.slug, input.slug),
-          eq(publicJobListings.isPublished, 1)
-        ),
-      });
+      const database = await db.getDb();
+      if (!database) return null;
 
-      if (!listing) return null;
+      const [row] = await database
+        .select({ listing: publicJobListings, job: jobs })
+        .from(publicJobListings)
+        .leftJoin(jobs, eq(jobs.id, publicJobListings.jobId))
+        .where(
+          and(
+            eq(publicJobListings.slug, input.slug),
+            eq(publicJobListings.isPublished, 1)
+          )
+        )
+        .limit(1);
 
-      // Increment view count
-      await db.getDb()
-        .update(publicJobListings)
-        .set({ views: (listing.views || 0) + 1 })
-        .where(eq(publicJobListings.id, listing.id));
+      if (!row) return null;
 
-      const job = await db.getDb().query.jobs.findFirst({
-        where: eq(jobs.id, listing.jobId),
-      });
+      // Increment in SQL: one statement, and concurrent views can't overwrite
+      // each other's read-modify-write
+      await database
+        .update(publicJobListings)
+        .set({ views: sql`COALESCE(${publicJobListings.views}, 0) + 1` })
+        .where(eq(publicJobListings.id, row.listing.id));
 
       return {
-        ...listing,
-        job,
+        ...row.listing,
+        job: row.job,
       };
     }),
 
@@ -81,7 +116,10 @@ export const jobBoardRouter = router({
       })
     )
     .mutation(async ({ input }) => {
-      const [application] = await db.getDb().insert(publicApplications).values({
+      const database = await db.getDb();
+      if (!database) throw new Error("Database not available");
+
+      const [application] = await database.insert(publicApplications).values({
         jobId: input.jobId,
         firstName: input.firstName,
         lastName: input.lastName,
@@ -91,22 +129,17 @@ export const jobBoardRouter = router({
         coverLetter: input.coverLetter,
         linkedinUrl: input.linkedinUrl,
         portfolioUrl: input.portfolioUrl,
-        answers: input.answers ? JSON.stringify(input.answers) : null,
+        answers: input.answers ?? null,
         source: input.source,
         status: "new",
       });
 
-      // Increment application count
-      const listing = await db.getDb().query.publicJobListings.findFirst({
-        where: eq(publicJobListings.jobId, input.jobId),
-      });
-
-      if (listing) {
-        await db.getDb()
-          .update(publicJobListings)
-          .set({ applications: (listing.applications || 0) + 1 })
-          .where(eq(publicJobListings.id, listing.id));
-      }
+      // Keep the listing's stored count current with a single UPDATE rather
+      // than reading the listing back just to write count + 1
+      await database
+        .update(publicJobListings)
+        .set({ applications: sql`COALESCE(${publicJobListings.applications}, 0) + 1` })
+        .where(eq(publicJobListings.jobId, input.jobId));
 
       return { id: application.insertId };
     }),
@@ -134,6 +167,7 @@ export const jobBoardRouter = router({
         metaTitle: input.metaTitle,
         metaDescription: input.metaDescription,
       });
+      invalidatePublishedJobs();
 
       return { id: listing.insertId };
     }),
@@ -148,6 +182,7 @@ export const jobBoardRouter = router({
         .update(publicJobListings)
         .set({ isPublished: 0 })
         .where(eq(publicJobListings.jobId, input.jobId));
+      invalidatePublishedJobs();
 
       return { success: true };
     }),
@@ -162,7 +197,7 @@ export const jobBoardRouter = router({
 
     return applications.map((app) => ({
       ...app,
-      answers: app.answers ? JSON.parse(app.answers as string) : {},
+      answers: app.answers ?? {},
     }));
   }),
 
@@ -209,7 +244,7 @@ export const jobBoardRouter = router({
 
     return {
       ...settings,
-      customQuestions: settings.customQuestions ? JSON.parse(settings.customQuestions as string) : [],
+      customQuestions: settings.customQuestions ?? [],
     };
   }),
 
@@ -247,13 +282,13 @@ export const jobBoardRouter = router({
           .update(jobBoardSettings)
           .set({
             ...input,
-            customQuestions: input.customQuestions ? JSON.stringify(input.customQuestions) : null,
+            customQuestions: input.customQuestions ?? null,
           })
           .where(eq(jobBoardSettings.id, existing.id));
       } else {
         await db.getDb().insert(jobBoardSettings).values({
           ...input,
-          customQuestions: input.customQuestions ? JSON.stringify(input.customQuestions) : null,
+          customQuestions: input.customQuestions ?? null,
         });
       }
 
@@ -264,18 +299,28 @@ export const jobBoardRouter = router({
    * Get job board statistics
    */
   getStats: protectedProcedure.query(async () => {
-    const listings = await db.getDb().query.publicJobListings.findMany();
-    const applications = await db.getDb().query.publicApplications.findMany();
-
-    const stats = {
-      totalJobs: listings.length,
-      publishedJobs: listings.filter((l) => l.isPublished === 1).length,
-      totalViews: listings.reduce((sum, l) => sum + (l.views || 0), 0),
-      totalApplications: applications.length,
-      newApplications: applications.filter((a) => a.status === "new").length,
-      shortlistedApplications: applications.filter((a) => a.status === "shortlisted").length,
-    };
+    const database = await db.getDb();
+    if (!database) throw new Error("Database not available");
+
+    // Aggregate in SQL instead of loading every listing and application row
+    // to count them
+    const [[listingStats], [applicationStats]] = await Promise.all([
+      database
+        .select({
+          totalJobs: count(),
+          publishedJobs: sql<number>`COALESCE(SUM(${publicJobListings.isPublished} = 1), 0)`.mapWith(Number),
+          totalViews: sql<number>`COALESCE(SUM(${publicJobListings.views}), 0)`.mapWith(Number),
+        })
+        .from(publicJobListings),
+      database
+        .select({
+          totalApplications: count(),
+          newApplications: sql<number>`COALESCE(SUM(${publicApplications.status} = 'new'), 0)`.mapWith(Number),
+          shortlistedApplications: sql<number>`COALESCE(SUM(${publicApplications.status} = 'shortlisted'), 0)`.mapWith(Number),
+        })
+        .from(publicApplications),
+    ]);
 
-    return stats;
+    return { ...listingStats, ...applicationStats };
   }),
 });
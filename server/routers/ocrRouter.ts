@@ -6,6 +6,7 @@ import {
   autoFillFromI9,
   autoFillFromW4,
   validateExtractedData,
+  REQUIRED_EXTRACTED_FIELDS,
 } from "../services/ocrService";
 import * as db from "../db";
 
@@ -28,14 +29,10 @@ export const ocrRouter = router({
         );
 
         // Validate extracted data
-        const requiredFields =
-          input.documentType === "i9"
-            ? ["firstName", "lastName", "address", "city", "state", "zipCode", "dateOfBirth"]
-            : input.documentType === "w4"
-            ? ["firstName", "lastName", "address", "city", "state", "zipCode"]
-            : [];
-
-        const validation = validateExtractedData(extractedData, requiredFields);
+        const validation = validateExtractedData(
+          extractedData,
+          REQUIRED_EXTRACTED_FIELDS[input.documentType]
+        );
 
         return {
           ...extractedData,
@@ -4,50 +4,53 @@ import { TRPCError } from "@trpc/server";
 import * as db from "../db";
 import { storagePut } from "../storage";
 
+/**
+ * The signed-in user's program enrollments, matched to candidate records by
+ * email. In a real system you'd have a direct link between users and
+ * candidates.
+ */
+async function getMyEnrollments(email: string | null | undefined) {
+  if (!email) return [];
+  return db.getParticipantsByCandidateEmail(email);
+}
+
 export const participantPortalRouter = router({
   /**
    * Get participant's own progress
    */
   getMyProgress: protectedProcedure.query(async ({ ctx }) => {
-    // Find candidate by user email
-    const candidates = await db.getAllParticipants();
-    const userEmail = ctx.user.email;
-    
-    // Get all candidates to find matching email
-    // In a real system, you'd have a direct link between users and candidates
     const allCandidates: any[] = [];
-    for (const participant of candidates) {
-      const candidate = await db.getCandidateById(participant.candidateId);
-      if (candidate && candidate.email.toLowerCase() === userEmail?.toLowerCase()) {
-        const program = await db.getProgramById(participant.programId);
-        const stages = await db.getStagesByProgramId(participant.programId);
-        const currentStage = stages.find(s => s.id === participant.currentStageId);
-        
-        // Calculate progress
-        const stageOrder = currentStage?.order || 0;
-        const progress = stages.length > 0 ? (stageOrder / stages.length) * 100 : 0;
-        
-        allCandidates.push({
-          participantId: participant.id,
-          candidateId: candidate.id,
-          candidateName: candidate.name,
-          programId: program?.id,
-          programName: program?.name,
-          status: participant.status,
-          currentStage: currentStage?.name || "Not started",
-          currentStageId: participant.currentStageId,
-          progress: Math.round(progress),
-          startedAt: participant.startedAt,
-          completedAt: participant.completedAt,
-          stages: stages.map(s => ({
-            id: s.id,
-            name: s.name,
-            order: s.order,
-            isComplete: s.order < stageOrder,
-            isCurrent: s.id === participant.currentStageId,
-          })),
-        });
-      }
+    for (const { participant, candidate } of await getMyEnrollments(ctx.user.email)) {
+      const [program, stages] = await Promise.all([
+        db.getProgramById(participant.programId),
+        db.getStagesByProgramId(participant.programId),
+      ]);
+      const currentStage = stages.find(s => s.id === participant.currentStageId);
+      
+      // Calculate progress
+      const stageOrder = currentStage?.order || 0;
+      const progress = stages.length > 0 ? (stageOrder / stages.length) * 100 : 0;
+      
+      allCandidates.push({
+        participantId: participant.id,
+        candidateId: candidate.id,
+        candidateName: candidate.name,
+        programId: program?.id,
+        programName: program?.name,
+        status: participant.status,
+        currentStage: currentStage?.name || "Not started",
+        currentStageId: participant.currentStageId,
+        progress: Math.round(progress),
+        startedAt: participant.startedAt,
+        completedAt: participant.completedAt,
+        stages: stages.map(s => ({
+          id: s.id,
+          name: s.name,
+          order: s.order,
+          isComplete: s.order < stageOrder,
+          isCurrent: s.id === participant.currentStageId,
+        })),
+      });
     }
     
     return allCandidates;
@@ -57,34 +60,28 @@ export const participantPortalRouter = router({
    * Get participant's documents
    */
   getMyDocuments: protectedProcedure.query(async ({ ctx }) => {
-    // Find candidate by user email
-    const candidates = await db.getAllParticipants();
-    const userEmail = ctx.user.email;
-    
     const allDocuments: any[] = [];
-    for (const participant of candidates) {
-      const candidate = await db.getCandidateById(participant.candidateId);
-      if (candidate && candidate.email.toLowerCase() === userEmail?.toLowerCase()) {
-        const documents = await db.getDocumentsByCandidate(candidate.id);
-        
-        for (const doc of documents) {
-          const requirement = doc.requirementId 
-            ? await db.getRequirementsByStageId(participant.currentStageId).then(reqs => 
-                reqs.find((r: any) => r.id === doc.requirementId)
-              )
-            : null;
-          
-          allDocuments.push({
-            id: doc.id,
-            name: doc.name,
-            fileUrl: doc.fileUrl,
-            fileSize: doc.fileSize,
-            status: doc.status,
-            createdAt: doc.createdAt,
-            requirementName: requirement?.name || "General Document",
-            programName: (await db.getProgramById(participant.programId))?.name,
-          });
-        }
+    for (const { participant, candidate } of await getMyEnrollments(ctx.user.email)) {
+      // Per enrollment, not per document: the stage's requirements and the
+      // program are the same for every document listed under it
+      const [documents, requirements, program] = await Promise.all([
+        db.getDocumentsByCandidate(candidate.id),
+        db.getRequirementsByStageId(participant.currentStageId),
+        db.getProgramById(participant.programId),
+      ]);
+      const requirementNames = new Map(requirements.map(r => [r.id, r.name] as const));
+
+      for (const doc of documents) {
+        allDocuments.push({
+          id: doc.id,
+          name: doc.name,
+          fileUrl: doc.fileUrl,
+          fileSize: doc.fileSize,
+          status: doc.status,
+          createdAt: doc.createdAt,
+          requirementName: (doc.requirementId && requirementNames.get(doc.requirementId)) || "General Document",
+          programName: program?.name,
+        });
       }
     }
     
@@ -104,18 +101,8 @@ export const participantPortalRouter = router({
       })
     )
     .mutation(async ({ ctx, input }) => {
-      // Find candidate by user email
-      const candidates = await db.getAllParticipants();
-      const userEmail = ctx.user.email;
-      
-      let candidateId: number | null = null;
-      for (const participant of candidates) {
-        const candidate = await db.getCandidateById(participant.candidateId);
-        if (candidate && candidate.email.toLowerCase() === userEmail?.toLowerCase()) {
-          candidateId = candidate.id;
-          break;
-        }
-      }
+      const [enrollment] = await getMyEnrollments(ctx.user.email);
+      const candidateId = enrollment?.candidate.id ?? null;
       
       if (!candidateId) {
         throw new TRPCError({
@@ -153,33 +140,27 @@ export const participantPortalRouter = router({
    * Get required documents for participant
    */
   getRequiredDocuments: protectedProcedure.query(async ({ ctx }) => {
-    const candidates = await db.getAllParticipants();
-    const userEmail = ctx.user.email;
-    
     const requiredDocs: any[] = [];
-    for (const participant of candidates) {
-      const candidate = await db.getCandidateById(participant.candidateId);
-      if (candidate && candidate.email.toLowerCase() === userEmail?.toLowerCase()) {
-        const stages = await db.getStagesByProgramId(participant.programId);
-        const currentStage = stages.find(s => s.id === participant.currentStageId);
+    for (const { participant, candidate } of await getMyEnrollments(ctx.user.email)) {
+      const stages = await db.getStagesByProgramId(participant.programId);
+      const currentStage = stages.find(s => s.id === participant.currentStageId);
+      
+      if (currentStage) {
+        const requirements = await db.getRequirementsByStageId(currentStage.id);
+        const documents = await db.getDocumentsByCandidate(candidate.id);
         
-        if (currentStage) {
-          const requirements = await db.getRequirementsByStageId(currentStage.id);
-          const documents = await db.getDocumentsByCandidate(candidate.id);
-          
-          for (const req of requirements) {
-            if ((req as any).type === "document") {
-              const uploaded = documents.find(d => d.requirementId === req.id);
-              requiredDocs.push({
-                id: req.id,
-                name: req.name,
-                description: req.description,
-                stageName: currentStage.name,
-                uploaded: !!uploaded,
-                uploadedDocId: uploaded?.id,
-                status: uploaded?.status || "missing",
-              });
-            }
+        for (const req of requirements) {
+          if ((req as any).type === "document") {
+            const uploaded = documents.find(d => d.requirementId === req.id);
+            requiredDocs.push({
+              id: req.id,
+              name: req.name,
+              description: req.description,
+              stageName: currentStage.name,
+              uploaded: !!uploaded,
+              uploadedDocId: uploaded?.id,
+              status: uploaded?.status || "missing",
+            });
           }
         }
       }
@@ -90,7 +90,7 @@ export const performanceReviewsRouter = router({
           overallRating: input.overallRating,
           strengths: input.strengths,
           areasForImprovement: input.areasForImprovement,
-          goals: JSON.stringify(input.goals),
+          goals: input.goals,
           comments: input.comments,
           status: "submitted",
           submittedAt: new Date(),
@@ -117,7 +117,7 @@ export const performanceReviewsRouter = router({
 
       return reviews.map((review) => ({
         ...review,
-        goals: review.goals ? JSON.parse(review.goals as string) : [],
+        goals: review.goals ?? [],
       }));
     }),
 
@@ -251,7 +251,7 @@ export const performanceReviewsRouter = router({
         description: input.description,
         startDate: input.startDate,
         endDate: input.endDate,
-        goals: JSON.stringify(input.goals),
+        goals: input.goals,
         status: "active",
       });
 
@@ -275,7 +275,7 @@ export const performanceReviewsRouter = router({
 
       return pips.map((pip) => ({
         ...pip,
-        goals: pip.goals ? JSON.parse(pip.goals as string) : [],
+        goals: pip.goals ?? [],
       }));
     }),
 
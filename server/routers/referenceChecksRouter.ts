@@ -3,6 +3,7 @@ import { protectedProcedure, publicProcedure, router } from "../_core/trpc";
 import { TRPCError } from "@trpc/server";
 import * as db from "../db";
 import { sendEmail } from "../services/productionEmail";
+import { ENV } from "../_core/env";
 
 export const referenceChecksRouter = router({
   /**
@@ -79,7 +80,7 @@ export const referenceChecksRouter = router({
         : null;
 
       // Generate reference check link
-      const baseUrl = process.env.VITE_APP_URL || "https://your-domain.com";
+      const baseUrl = ENV.appUrl || "https://your-domain.com";
       const referenceLink = `${baseUrl}/reference-check/${check.id}`;
 
       // Send email
@@ -232,7 +233,7 @@ export const referenceChecksRouter = router({
       }
 
       const candidate = await db.getCandidateById(check.candidateId);
-      const baseUrl = process.env.VITE_APP_URL || "https://your-domain.com";
+      const baseUrl = ENV.appUrl || "https://your-domain.com";
       const referenceLink = `${baseUrl}/reference-check/${check.id}`;
 
       const emailSubject = `Reminder: Reference Check Request for ${candidate?.name || "Candidate"}`;
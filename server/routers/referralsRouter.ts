@@ -1,17 +1,21 @@
+import { randomBytes } from "crypto";
 import { z } from "zod";
 import { protectedProcedure, router } from "../_core/trpc";
 import * as db from "../db";
 import { referrals } from "../../drizzle/schema";
 import { eq, and, desc } from "drizzle-orm";
 
+const REFERRAL_CODE_CHARS = "ABCDEFGHJKLMNPQRSTUVWXYZ23456789";
+
 /**
  * Generate unique referral code
  */
 function generateReferralCode(): string {
-  const chars = "ABCDEFGHJKLMNPQRSTUVWXYZ23456789";
+  // 32 symbols, so the low 5 bits of each random byte pick one without bias
+  const bytes = randomBytes(8);
   let code = "";
-  for (let i = 0; i < 8; i++) {
-    code += chars.charAt(Math.floor(Math.random() * chars.length));
+  for (let i = 0; i < bytes.length; i++) {
+    code += REFERRAL_CODE_CHARS[bytes[i] & 31];
   }
   return code;
 }
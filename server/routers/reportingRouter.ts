@@ -21,7 +21,7 @@ export const reportingRouter = router({
     )
     .query(async ({ input }) => {
       // Fetch all candidates in date range
-      const allCandidates = await db.getAllCandidates();
+      const allCandidates = await db.getAllCandidateSummaries();
       const candidates = allCandidates.filter((c) => {
         const createdAt = new Date(c.createdAt);
         return createdAt >= input.startDate && createdAt <= input.endDate;
@@ -76,7 +76,7 @@ export const reportingRouter = router({
     )
     .mutation(async ({ input }) => {
       // Fetch data
-      const allCandidates = await db.getAllCandidates();
+      const allCandidates = await db.getAllCandidateSummaries();
       const candidates = allCandidates.filter((c) => {
         const createdAt = new Date(c.createdAt);
         return createdAt >= input.startDate && createdAt <= input.endDate;
@@ -139,7 +139,7 @@ export const reportingRouter = router({
     )
     .mutation(async ({ input }) => {
       // Fetch data (same as PDF)
-      const allCandidates = await db.getAllCandidates();
+      const allCandidates = await db.getAllCandidateSummaries();
       const candidates = allCandidates.filter((c) => {
         const createdAt = new Date(c.createdAt);
         return createdAt >= input.startDate && createdAt <= input.endDate;
@@ -200,7 +200,7 @@ export const reportingRouter = router({
     )
     .mutation(async ({ input }) => {
       // Fetch data
-      const candidates = await db.getAllCandidates();
+      const candidates = await db.getAllCandidateSummaries();
       const jobs = await db.getAllJobs();
       const programs = await db.getAllPrograms();
 
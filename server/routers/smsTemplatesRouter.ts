@@ -169,12 +169,7 @@ export const smsTemplatesRouter = router({
       }
 
       // Clear existing default for this type
-      const allTemplates = await db.getSmsTemplates();
-      for (const t of allTemplates) {
-        if ((t as any).type === template.type && (t as any).isDefault === 1) {
-          await db.updateSmsTemplate(t.id, { isDefault: 0 });
-        }
-      }
+      await db.clearDefaultSmsTemplates(template.type);
 
       // Set new default
       await db.updateSmsTemplate(input.id, { isDefault: 1 });
@@ -54,7 +54,7 @@ export interface SearchResult {
  * Search participants with fuzzy matching
  */
 export async function searchParticipants(query: string, limit: number = 20): Promise<SearchResult[]> {
-  const allCandidates = await db.getAllCandidates();
+  const allCandidates = await db.getAllCandidateSummaries();
   const results: SearchResult[] = [];
 
   for (const candidate of allCandidates) {
@@ -6,6 +6,8 @@
 
 import * as db from "../db";
 
+const DAY_MS = 24 * 60 * 60 * 1000;
+
 export interface ProgramCompletionTrend {
   date: string;
   completed: number;
@@ -50,33 +52,38 @@ export async function getProgramCompletionTrends(
   startDate?: Date,
   endDate?: Date
 ): Promise<ProgramCompletionTrend[]> {
-  const participants = await db.getAllParticipants();
-  
-  // Filter by program if specified
-  let filtered = programId
-    ? participants.filter(p => p.programId === programId)
-    : participants;
+  // Filter by program in the query rather than over every participant
+  const participants = programId
+    ? await db.getParticipantsByProgramId(programId)
+    : await db.getAllParticipants();
+  const startMs = startDate?.getTime();
+  const endMs = endDate?.getTime();
 
   // Group by date
   const trendsMap = new Map<string, ProgramCompletionTrend>();
 
-  for (const participant of filtered) {
-    const date = new Date(participant.startedAt).toISOString().split('T')[0];
+  for (const participant of participants) {
+    // Start of the participant's UTC start day, from arithmetic rather than
+    // formatting an ISO string, splitting it and parsing the half back
+    const startedMs = participant.startedAt.getTime();
+    const dayMs = startedMs - (((startedMs % DAY_MS) + DAY_MS) % DAY_MS);
     
     // Skip if outside date range
-    if (startDate && new Date(date) < startDate) continue;
-    if (endDate && new Date(date) > endDate) continue;
+    if (startMs !== undefined && dayMs < startMs) continue;
+    if (endMs !== undefined && dayMs > endMs) continue;
 
-    if (!trendsMap.has(date)) {
-      trendsMap.set(date, {
+    const date = new Date(dayMs).toISOString().slice(0, 10);
+    let trend = trendsMap.get(date);
+    if (!trend) {
+      trend = {
         date,
         completed: 0,
         active: 0,
         dropped: 0,
-      });
+      };
+      trendsMap.set(date, trend);
     }
 
-    const trend = trendsMap.get(date)!;
     if (participant.status === "completed") {
       trend.completed++;
     } else if (participant.status === "active") {
@@ -120,7 +127,7 @@ export async function getTimeToCompletionMetrics(): Promise<TimeToCompletionMetr
     const daysToCompletion = completedParticipants.map(p => {
       const start = new Date(p.startedAt).getTime();
       const end = new Date(p.updatedAt).getTime(); // Assuming updatedAt is completion date
-      return Math.floor((end - start) / (1000 * 60 * 60 * 24));
+      return Math.floor((end - start) / DAY_MS);
     }).sort((a, b) => a - b);
 
     const average = daysToCompletion.reduce((sum, days) => sum + days, 0) / daysToCompletion.length;
@@ -163,7 +170,7 @@ export async function getBottleneckAnalysis(): Promise<BottleneckAnalysis[]> {
       const timesInStage = participantsInStage.map(p => {
         const start = new Date(p.startedAt).getTime();
         const now = Date.now();
-        return Math.floor((now - start) / (1000 * 60 * 60 * 24));
+        return Math.floor((now - start) / DAY_MS);
       });
 
       const averageTime = timesInStage.reduce((sum, days) => sum + days, 0) / timesInStage.length;
@@ -235,7 +242,7 @@ export async function getParticipantSatisfactionMetrics(): Promise<ParticipantSa
       if (p.status !== "completed") return false;
       const start = new Date(p.startedAt).getTime();
       const end = new Date(p.updatedAt).getTime();
-      const days = Math.floor((end - start) / (1000 * 60 * 60 * 24));
+      const days = Math.floor((end - start) / DAY_MS);
       return days <= expectedDays;
     }).length;
     const onTimeRate = completed > 0 ? (onTimeCompletions / completed) * 100 : 0;
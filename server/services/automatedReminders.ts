@@ -159,18 +159,24 @@ export async function sendPendingApprovalReminders(settings: ReminderSettings =
   console.log("[Reminders] Starting pending approval reminders...");
 
   try {
-    // Get all pending documents grouped by staff
-    const pendingDocuments = await db.getPendingDocuments();
+    const pendingCount = await db.countPendingDocuments();
 
-    if (pendingDocuments.length === 0) {
+    if (pendingCount === 0) {
       console.log("[Reminders] No pending documents found");
       return { sent: 0, failed: 0 };
     }
 
-    // Group by uploaded by (staff member who needs to approve)
-    // For now, send to all admin users
-    const users = await db.getAllUsers();
-    const adminUsers = users.filter((u: any) => u.role === "admin");
+    // For now, send to all admin users. Every admin gets the same digest,
+    // so it is built once up front rather than per recipient
+    const [adminUsers, pendingDocuments] = await Promise.all([
+      db.getAdminContacts(),
+      db.getRecentPendingDocuments(5),
+    ]);
+    const recentDocuments = pendingDocuments.map(doc => ({
+      name: doc.name,
+      candidateName: doc.candidateName || "Unknown",
+      uploadedAt: doc.uploadedAt,
+    }));
 
     let sent = 0;
     let failed = 0;
@@ -179,23 +185,11 @@ export async function sendPendingApprovalReminders(settings: ReminderSettings =
       if (!admin.email) continue;
 
       try {
-        // Get recent documents for this admin
-        const recentDocuments = await Promise.all(
-          pendingDocuments.slice(0, 5).map(async (doc) => {
-            const candidate = await db.getCandidateById(doc.candidateId);
-            return {
-              name: doc.name,
-              candidateName: candidate?.name || "Unknown",
-              uploadedAt: doc.createdAt,
-            };
-          })
-        );
-
         // Send reminder
         const success = await sendPendingApprovalReminder({
           staffName: admin.name || "Admin",
           staffEmail: admin.email,
-          pendingCount: pendingDocuments.length,
+          pendingCount,
           recentDocuments,
           approvalUrl: `${process.env.VITE_FRONTEND_URL || "https://yourapp.com"}/documents/approval`,
           organizationName: process.env.VITE_APP_TITLE || "HR Platform",
@@ -154,8 +154,7 @@ async function importParticipant(row: ParticipantImportRow): Promise<{ candidate
   }
 
   // Check if candidate already exists by email
-  const existingCandidates = await db.getCandidatesByJob(jobId!);
-  let candidate = existingCandidates.find((c: any) => c.email.toLowerCase() === row.email.toLowerCase());
+  let candidate = await db.getCandidateByEmailAndJob(row.email, jobId!);
 
   if (!candidate) {
     // Create new candidate
@@ -5,6 +5,16 @@
  */
 
 import { google } from "googleapis";
+import { ENV } from "../_core/env";
+
+/**
+ * Google OAuth client credentials, resolved once from the environment
+ */
+export const GOOGLE_CALENDAR_CREDENTIALS = {
+  clientId: ENV.googleCalendarClientId,
+  clientSecret: ENV.googleCalendarClientSecret,
+  redirectUri: ENV.googleCalendarRedirectUri,
+} as const;
 
 export interface CalendarEvent {
   id?: string;
@@ -346,11 +356,7 @@ export async function scheduleAppointment(
   };
 
   if (provider.type === "google") {
-    const service = new GoogleCalendarService({
-      clientId: process.env.GOOGLE_CALENDAR_CLIENT_ID || "",
-      clientSecret: process.env.GOOGLE_CALENDAR_CLIENT_SECRET || "",
-      redirectUri: process.env.GOOGLE_CALENDAR_REDIRECT_URI || "",
-    });
+    const service = new GoogleCalendarService(GOOGLE_CALENDAR_CREDENTIALS);
     service.setCredentials(provider.accessToken, provider.refreshToken);
     return await service.createEvent(event);
   } else {
@@ -382,11 +388,7 @@ export async function scheduleTrainingSession(
   };
 
   if (provider.type === "google") {
-    const service = new GoogleCalendarService({
-      clientId: process.env.GOOGLE_CALENDAR_CLIENT_ID || "",
-      clientSecret: process.env.GOOGLE_CALENDAR_CLIENT_SECRET || "",
-      redirectUri: process.env.GOOGLE_CALENDAR_REDIRECT_URI || "",
-    });
+    const service = new GoogleCalendarService(GOOGLE_CALENDAR_CREDENTIALS);
     service.setCredentials(provider.accessToken, provider.refreshToken);
     return await service.createEvent(event);
   } else {
@@ -426,11 +428,7 @@ export async function scheduleDeadlineReminder(
   };
 
   if (provider.type === "google") {
-    const service = new GoogleCalendarService({
-      clientId: process.env.GOOGLE_CALENDAR_CLIENT_ID || "",
-      clientSecret: process.env.GOOGLE_CALENDAR_CLIENT_SECRET || "",
-      redirectUri: process.env.GOOGLE_CALENDAR_REDIRECT_URI || "",
-    });
+    const service = new GoogleCalendarService(GOOGLE_CALENDAR_CREDENTIALS);
     service.setCredentials(provider.accessToken, provider.refreshToken);
     return await service.createEvent(event);
   } else {
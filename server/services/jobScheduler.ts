@@ -3,6 +3,7 @@ import { sendDailyReminders } from "./automatedReminders";
 import * as db from "../db";
 import { sendEmail } from "./productionEmail";
 import { createDatabaseBackup } from "./backupAndExport";
+import { ENV } from "../_core/env";
 
 interface JobLog {
   jobName: string;
@@ -14,20 +15,28 @@ interface JobLog {
 const jobLogs: JobLog[] = [];
 const MAX_LOGS = 1000;
 
-function logJob(jobName: string, status: "success" | "error", message: string) {
-  jobLogs.unshift({
-    jobName,
-    status,
-    message,
-    timestamp: new Date(),
-  });
+/**
+ * Build a logger bound to one job. The console prefix is formatted once when
+ * the job is scheduled instead of on every run.
+ */
+function createJobLogger(jobName: string) {
+  const prefix = `[Job Scheduler] ${jobName} - `;
 
-  // Keep only last MAX_LOGS entries
-  if (jobLogs.length > MAX_LOGS) {
-    jobLogs.pop();
-  }
+  return (status: "success" | "error", message: string) => {
+    jobLogs.unshift({
+      jobName,
+      status,
+      message,
+      timestamp: new Date(),
+    });
 
-  console.log(`[Job Scheduler] ${jobName} - ${status}: ${message}`);
+    // Keep only last MAX_LOGS entries
+    if (jobLogs.length > MAX_LOGS) {
+      jobLogs.pop();
+    }
+
+    console.log(prefix + status + ": " + message);
+  };
 }
 
 export function getJobLogs(limit: number = 100) {
@@ -39,6 +48,8 @@ export function getJobLogs(limit: number = 100) {
  * Runs every day at 9:00 AM
  */
 export function startDailyReminderJob() {
+  const logJob = createJobLogger("Daily Reminders");
+
   cron.schedule("0 9 * * *", async () => {
     try {
       console.log("[Job Scheduler] Starting daily reminder job...");
@@ -46,12 +57,11 @@ export function startDailyReminderJob() {
       const result = await sendDailyReminders();
       
       logJob(
-        "Daily Reminders",
         "success",
         `Sent ${result.totalSent} notifications (${result.totalFailed} failed)`
       );
     } catch (error: any) {
-      logJob("Daily Reminders", "error", error.message);
+      logJob("error", error.message);
     }
   });
 
@@ -63,27 +73,29 @@ export function startDailyReminderJob() {
  * Runs every day at 2:00 AM
  */
 export function startExpiredReferenceChecksJob() {
+  const logJob = createJobLogger("Expired Reference Checks");
+
   cron.schedule("0 2 * * *", async () => {
     try {
       console.log("[Job Scheduler] Starting expired reference checks job...");
       
       const pendingChecks = await db.getPendingReferenceChecks();
+      const now = new Date();
       let expiredCount = 0;
 
       for (const check of pendingChecks) {
-        if (check.expiresAt && new Date() > check.expiresAt) {
+        if (check.expiresAt && now > check.expiresAt) {
           await db.updateReferenceCheck(check.id, { status: "expired" });
           expiredCount++;
         }
       }
 
       logJob(
-        "Expired Reference Checks",
         "success",
         `Processed ${expiredCount} expired reference checks`
       );
     } catch (error: any) {
-      logJob("Expired Reference Checks", "error", error.message);
+      logJob("error", error.message);
     }
   });
 
@@ -95,6 +107,8 @@ export function startExpiredReferenceChecksJob() {
  * Runs every Monday at 8:00 AM
  */
 export function startWeeklyComplianceReportJob() {
+  const logJob = createJobLogger("Weekly Compliance Report");
+
   cron.schedule("0 8 * * 1", async () => {
     try {
       console.log("[Job Scheduler] Starting weekly compliance report job...");
@@ -120,9 +134,10 @@ export function startWeeklyComplianceReportJob() {
       }
 
       // Generate HTML report
+      const reportDate = new Date().toLocaleDateString();
       const reportHtml = `
         <h2>Weekly Compliance Report</h2>
-        <p>Report generated on ${new Date().toLocaleDateString()}</p>
+        <p>Report generated on ${reportDate}</p>
         <table border="1" cellpadding="10" cellspacing="0" style="border-collapse: collapse; width: 100%;">
           <thead>
             <tr style="background-color: #f0f0f0;">
@@ -148,21 +163,20 @@ export function startWeeklyComplianceReportJob() {
       `;
 
       // Send report to admin (you can configure the recipient email)
-      const adminEmail = process.env.ADMIN_EMAIL || "admin@example.com";
+      const adminEmail = ENV.adminEmail;
       
       await sendEmail({
         to: adminEmail,
-        subject: `Weekly Compliance Report - ${new Date().toLocaleDateString()}`,
+        subject: `Weekly Compliance Report - ${reportDate}`,
         html: reportHtml,
       });
 
       logJob(
-        "Weekly Compliance Report",
         "success",
         `Report sent to ${adminEmail} with ${programs.length} programs`
       );
     } catch (error: any) {
-      logJob("Weekly Compliance Report", "error", error.message);
+      logJob("error", error.message);
     }
   });
 
@@ -174,6 +188,8 @@ export function startWeeklyComplianceReportJob() {
  * Runs every 3 days at 10:00 AM
  */
 export function startReferenceCheckRemindersJob() {
+  const logJob = createJobLogger("Reference Check Reminders");
+
   cron.schedule("0 10 */3 * *", async () => {
     try {
       console.log("[Job Scheduler] Starting reference check reminders job...");
@@ -189,7 +205,7 @@ export function startReferenceCheckRemindersJob() {
 
         if (daysSinceSent >= 3 && (check.reminderCount || 0) < 3) {
           const candidate = await db.getCandidateById(check.candidateId);
-          const baseUrl = process.env.VITE_APP_URL || "https://your-domain.com";
+          const baseUrl = ENV.appUrl || "https://your-domain.com";
           const referenceLink = `${baseUrl}/reference-check/${check.id}`;
 
           const emailSubject = `Reminder: Reference Check Request for ${candidate?.name || "Candidate"}`;
@@ -217,12 +233,11 @@ export function startReferenceCheckRemindersJob() {
       }
 
       logJob(
-        "Reference Check Reminders",
         "success",
         `Sent ${remindersSent} reminder emails`
       );
     } catch (error: any) {
-      logJob("Reference Check Reminders", "error", error.message);
+      logJob("error", error.message);
     }
   });
 
@@ -234,6 +249,8 @@ export function startReferenceCheckRemindersJob() {
  * Runs every day at 2:00 AM
  */
 export function startDailyBackupJob() {
+  const logJob = createJobLogger("Daily Database Backup");
+
   cron.schedule("0 2 * * *", async () => {
     try {
       console.log("[Job Scheduler] Starting daily database backup...");
@@ -242,29 +259,35 @@ export function startDailyBackupJob() {
       
       if (result.success) {
         logJob(
-          "Daily Database Backup",
           "success",
           `Database backup completed successfully. URL: ${result.backupUrl}`
         );
       } else {
         logJob(
-          "Daily Database Backup",
           "error",
           `Backup failed: ${result.error}`
         );
       }
     } catch (error: any) {
-      logJob("Daily Database Backup", "error", error.message);
+      logJob("error", error.message);
     }
   });
 
   console.log("[Job Scheduler] Daily database backup job scheduled (2:00 AM daily)");
 }
 
+let schedulerInitialized = false;
+
 /**
  * Initialize all scheduled jobs
+ * Safe to call more than once; cron tasks are only registered the first time
  */
 export function initializeJobScheduler() {
+  if (schedulerInitialized) {
+    return;
+  }
+  schedulerInitialized = true;
+
   console.log("[Job Scheduler] Initializing all scheduled jobs...");
   
   startDailyReminderJob();
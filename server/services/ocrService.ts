@@ -220,10 +220,22 @@ export function autoFillFromW4(extractedData: W4FormData) {
   };
 }
 
+/**
+ * Fields that must be present for extracted data to be considered valid,
+ * built once per document type instead of on every request
+ */
+export const REQUIRED_EXTRACTED_FIELDS: Readonly<
+  Record<"i9" | "w4" | "generic", readonly string[]>
+> = {
+  i9: ["firstName", "lastName", "address", "city", "state", "zipCode", "dateOfBirth"],
+  w4: ["firstName", "lastName", "address", "city", "state", "zipCode"],
+  generic: [],
+};
+
 /**
  * Validate extracted data quality
  */
-export function validateExtractedData(data: ExtractedData, requiredFields: string[]): {
+export function validateExtractedData(data: ExtractedData, requiredFields: readonly string[]): {
   isValid: boolean;
   missingFields: string[];
   lowConfidenceFields: string[];
@@ -233,7 +245,7 @@ export function validateExtractedData(data: ExtractedData, requiredFields: strin
 
   // Check for missing required fields
   for (const field of requiredFields) {
-    if (!data.fields[field] || data.fields[field] === "") {
+    if (!data.fields[field]) {
       missingFields.push(field);
     }
   }
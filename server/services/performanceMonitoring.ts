@@ -1,7 +1,8 @@
 interface PerformanceMetric {
   name: string;
   duration: number;
-  timestamp: Date;
+  /** Epoch milliseconds; callers format it when displaying */
+  timestamp: number;
   type: "api" | "database" | "job" | "websocket";
   metadata?: any;
 }
@@ -31,7 +32,7 @@ export function recordMetric(
   metrics.unshift({
     name,
     duration,
-    timestamp: new Date(),
+    timestamp: Date.now(),
     type,
     metadata,
   });
@@ -132,17 +133,27 @@ export function clearMetrics() {
   metrics.length = 0;
 }
 
+// Only API traffic is measured; static assets and the dev server's module
+// requests would otherwise swamp the "api" stats and cost a listener each
+const TRACKED_PATH_PREFIX = "/api/";
+
 /**
  * Middleware to track API response times
  */
 export function createPerformanceMiddleware() {
   return (req: any, res: any, next: any) => {
-    const start = Date.now();
+    // req.path is a getter that re-parses the URL; read it once
+    const path: string = req.path;
+    if (!path.startsWith(TRACKED_PATH_PREFIX)) {
+      return next();
+    }
+
+    const start = performance.now();
     
     res.on("finish", () => {
-      const duration = Date.now() - start;
+      const duration = performance.now() - start;
       recordMetric(
-        req.path || req.url,
+        path || req.url,
         duration,
         "api",
         {
@@ -163,17 +174,17 @@ export async function trackDatabaseQuery<T>(
   queryName: string,
   queryFn: () => Promise<T>
 ): Promise<T> {
-  const start = Date.now();
+  const start = performance.now();
   
   try {
     const result = await queryFn();
-    const duration = Date.now() - start;
+    const duration = performance.now() - start;
     
     recordMetric(queryName, duration, "database");
     
     return result;
   } catch (error) {
-    const duration = Date.now() - start;
+    const duration = performance.now() - start;
     recordMetric(queryName, duration, "database", { error: true });
     throw error;
   }
@@ -186,17 +197,17 @@ export async function trackJobExecution<T>(
   jobName: string,
   jobFn: () => Promise<T>
 ): Promise<T> {
-  const start = Date.now();
+  const start = performance.now();
   
   try {
     const result = await jobFn();
-    const duration = Date.now() - start;
+    const duration = performance.now() - start;
     
     recordMetric(jobName, duration, "job", { success: true });
     
     return result;
   } catch (error) {
-    const duration = Date.now() - start;
+    const duration = performance.now() - start;
     recordMetric(jobName, duration, "job", { success: false });
     throw error;
   }
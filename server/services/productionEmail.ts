@@ -21,6 +21,7 @@
  * - MAILGUN_DOMAIN: Mailgun domain
  */
 
+import { ENV } from '../_core/env';
 import { notifyOwner } from '../_core/notification';
 
 export interface EmailOptions {
@@ -43,14 +44,14 @@ class SendGridProvider implements EmailProvider {
   name = 'SendGrid';
   
   async send(options: EmailOptions): Promise<boolean> {
-    const apiKey = process.env.SENDGRID_API_KEY;
+    const apiKey = ENV.SENDGRID_API_KEY;
     if (!apiKey) {
       console.error('[Email] SendGrid API key not configured');
       return false;
     }
 
-    const from = process.env.EMAIL_FROM || 'noreply@example.com';
-    const fromName = process.env.EMAIL_FROM_NAME || 'HR Platform';
+    const from = ENV.emailFrom;
+    const fromName = ENV.emailFromName;
 
     try {
       const response = await fetch('https://api.sendgrid.com/v3/mail/send', {
@@ -113,8 +114,8 @@ class SESProvider implements EmailProvider {
       return false;
     }
 
-    const from = process.env.EMAIL_FROM || 'noreply@example.com';
-    const fromName = process.env.EMAIL_FROM_NAME || 'HR Platform';
+    const from = ENV.emailFrom;
+    const fromName = ENV.emailFromName;
 
     try {
       // AWS SES v2 API
@@ -167,6 +168,22 @@ class SESProvider implements EmailProvider {
   }
 }
 
+let cachedMailgunAuth: { apiKey: string; header: string } | null = null;
+
+/**
+ * Basic auth header for the Mailgun API, encoded once per key rather than
+ * once per message
+ */
+function getMailgunAuthHeader(apiKey: string): string {
+  if (!cachedMailgunAuth || cachedMailgunAuth.apiKey !== apiKey) {
+    cachedMailgunAuth = {
+      apiKey,
+      header: `Basic ${Buffer.from(`api:${apiKey}`).toString('base64')}`,
+    };
+  }
+  return cachedMailgunAuth.header;
+}
+
 /**
  * Mailgun email provider
  */
@@ -182,8 +199,8 @@ class MailgunProvider implements EmailProvider {
       return false;
     }
 
-    const from = process.env.EMAIL_FROM || 'noreply@example.com';
-    const fromName = process.env.EMAIL_FROM_NAME || 'HR Platform';
+    const from = ENV.emailFrom;
+    const fromName = ENV.emailFromName;
 
     try {
       const formData = new URLSearchParams();
@@ -201,7 +218,7 @@ class MailgunProvider implements EmailProvider {
       const response = await fetch(`https://api.mailgun.net/v3/${domain}/messages`, {
         method: 'POST',
         headers: {
-          'Authorization': `Basic ${Buffer.from(`api:${apiKey}`).toString('base64')}`,
+          'Authorization': getMailgunAuthHeader(apiKey),
         },
         body: formData,
       });
@@ -250,12 +267,19 @@ class ManusProvider implements EmailProvider {
   }
 }
 
+let cachedProvider: EmailProvider | null = null;
+
 /**
- * Get the configured email provider
+ * Get the configured email provider (created once, then reused)
  */
 function getEmailProvider(): EmailProvider {
-  const provider = process.env.EMAIL_PROVIDER?.toLowerCase() || 'manus';
+  if (!cachedProvider) {
+    cachedProvider = createEmailProvider(ENV.emailProvider);
+  }
+  return cachedProvider;
+}
 
+function createEmailProvider(provider: string): EmailProvider {
   switch (provider) {
     case 'sendgrid':
       return new SendGridProvider();
@@ -1,8 +1,33 @@
 import { Server as SocketIOServer } from "socket.io";
 import { Server as HTTPServer } from "http";
+import { ENV } from "../_core/env";
 
 let io: SocketIOServer | null = null;
 
+// Per-connection and per-notification lines are info-level chatter; skip
+// building them entirely when LOG_LEVEL is warn or error
+const logEvents = ENV.logLevel === "debug" || ENV.logLevel === "info";
+
+// Built once from the frozen ENV; the server only ever reads it
+const SOCKET_IO_CORS = {
+  // CORS_ORIGINS unset keeps the permissive default
+  origin:
+    ENV.corsOrigins.size === 0
+      ? "*"
+      : (
+          origin: string | undefined,
+          callback: (err: Error | null, allow?: boolean) => void
+        ) => {
+          callback(null, !origin || ENV.corsOrigins.has(origin));
+        },
+  methods: ["GET", "POST"],
+  // Let browsers reuse a preflight for an hour instead of repeating it ahead
+  // of every long-polling request
+  maxAge: 3600,
+};
+
+// Payloads are emitted as built: each carries the timestamp it was created
+// with, so sending doesn't copy it just to stamp a second Date
 export interface NotificationPayload {
   type: "document_uploaded" | "reference_completed" | "participant_milestone" | "approval_needed" | "general";
   title: string;
@@ -14,33 +39,43 @@ export interface NotificationPayload {
 
 /**
  * Initialize Socket.IO server
+ * Returns the existing server if already initialized, so handlers never stack
  */
 export function initializeSocketIO(httpServer: HTTPServer) {
+  if (io) {
+    return io;
+  }
+
   io = new SocketIOServer(httpServer, {
-    cors: {
-      origin: "*", // Configure based on your needs
-      methods: ["GET", "POST"],
-    },
+    cors: SOCKET_IO_CORS,
     path: "/api/socket.io",
   });
 
   io.on("connection", (socket) => {
-    console.log(`[Socket.IO] Client connected: ${socket.id}`);
+    if (logEvents) {
+      console.log(`[Socket.IO] Client connected: ${socket.id}`);
+    }
 
     // Join user-specific room
     socket.on("join", (userId: number) => {
       socket.join(`user:${userId}`);
-      console.log(`[Socket.IO] User ${userId} joined their room`);
+      if (logEvents) {
+        console.log(`[Socket.IO] User ${userId} joined their room`);
+      }
     });
 
     // Join admin room
     socket.on("join_admin", () => {
       socket.join("admin");
-      console.log(`[Socket.IO] Admin joined admin room`);
+      if (logEvents) {
+        console.log(`[Socket.IO] Admin joined admin room`);
+      }
     });
 
     socket.on("disconnect", () => {
-      console.log(`[Socket.IO] Client disconnected: ${socket.id}`);
+      if (logEvents) {
+        console.log(`[Socket.IO] Client disconnected: ${socket.id}`);
+      }
     });
   });
 
@@ -57,12 +92,11 @@ export function sendNotificationToUser(userId: number, notification: Notificatio
     return false;
   }
 
-  io.to(`user:${userId}`).emit("notification", {
-    ...notification,
-    timestamp: new Date(),
-  });
+  io.to(`user:${userId}`).emit("notification", notification);
 
-  console.log(`[Socket.IO] Notification sent to user ${userId}: ${notification.title}`);
+  if (logEvents) {
+    console.log(`[Socket.IO] Notification sent to user ${userId}: ${notification.title}`);
+  }
   return true;
 }
 
@@ -75,12 +109,11 @@ export function sendNotificationToAdmins(notification: NotificationPayload) {
     return false;
   }
 
-  io.to("admin").emit("notification", {
-    ...notification,
-    timestamp: new Date(),
-  });
+  io.to("admin").emit("notification", notification);
 
-  console.log(`[Socket.IO] Notification sent to admins: ${notification.title}`);
+  if (logEvents) {
+    console.log(`[Socket.IO] Notification sent to admins: ${notification.title}`);
+  }
   return true;
 }
 
@@ -93,12 +126,11 @@ export function broadcastNotification(notification: NotificationPayload) {
     return false;
   }
 
-  io.emit("notification", {
-    ...notification,
-    timestamp: new Date(),
-  });
+  io.emit("notification", notification);
 
-  console.log(`[Socket.IO] Broadcast notification: ${notification.title}`);
+  if (logEvents) {
+    console.log(`[Socket.IO] Broadcast notification: ${notification.title}`);
+  }
   return true;
 }
 
@@ -3,6 +3,7 @@
  * Enables legal e-signatures for offer letters with tracking and reminders
  */
 
+import { randomBytes } from "crypto";
 import { ENV } from "../_core/env";
 
 // SignSmart API configuration
@@ -51,7 +52,7 @@ export async function createSignatureRequest(request: SignatureRequest): Promise
     console.warn("SignSmart API key not configured - using mock mode");
     
     // Generate mock request ID
-    const requestId = `sig_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
+    const requestId = `sig_${Date.now()}_${randomBytes(4).toString("hex")}`;
     const signingUrl = `https://sign.signsmart.example.com/sign/${requestId}`;
     
     return { requestId, signingUrl };
@@ -34,6 +34,27 @@ function getSMSConfig(): SMSConfig {
   };
 }
 
+let cachedTwilioAuth: { accountSid: string; authToken: string; header: string } | null = null;
+
+/**
+ * Basic auth header for the Twilio API, base64-encoded once per credential
+ * pair rather than once per message
+ */
+function getTwilioAuthHeader(accountSid: string, authToken: string): string {
+  if (
+    !cachedTwilioAuth ||
+    cachedTwilioAuth.accountSid !== accountSid ||
+    cachedTwilioAuth.authToken !== authToken
+  ) {
+    cachedTwilioAuth = {
+      accountSid,
+      authToken,
+      header: `Basic ${Buffer.from(`${accountSid}:${authToken}`).toString("base64")}`,
+    };
+  }
+  return cachedTwilioAuth.header;
+}
+
 /**
  * Validate phone number format
  */
@@ -114,7 +135,7 @@ export async function sendSMS(message: SMSMessage): Promise<SMSResult> {
         method: "POST",
         headers: {
           "Content-Type": "application/x-www-form-urlencoded",
-          Authorization: `Basic ${Buffer.from(`${config.accountSid}:${config.authToken}`).toString("base64")}`,
+          Authorization: getTwilioAuthHeader(config.accountSid, config.authToken),
         },
         body: new URLSearchParams({
           To: toNumber,
@@ -79,6 +79,8 @@ export function sanitizePhone(phone: string): string {
   return cleaned;
 }
 
+const ALLOWED_URL_PROTOCOLS: ReadonlySet<string> = new Set(["http:", "https:"]);
+
 /**
  * Validate and sanitize URL
  */
@@ -87,7 +89,7 @@ export function sanitizeUrl(url: string): string {
   try {
     const parsed = new URL(trimmed);
     // Only allow http and https protocols
-    if (!["http:", "https:"].includes(parsed.protocol)) {
+    if (!ALLOWED_URL_PROTOCOLS.has(parsed.protocol)) {
       throw new Error("Invalid URL protocol");
     }
     return parsed.toString();
@@ -138,31 +140,31 @@ export function validateFileUpload(
  */
 export function validateFileType(
   mimeType: string,
-  allowedTypes: string[]
+  allowedTypes: ReadonlySet<string>
 ): boolean {
-  return allowedTypes.includes(mimeType);
+  return allowedTypes.has(mimeType);
 }
 
-/**
- * Allowed file types for resumes
- */
-export const ALLOWED_RESUME_TYPES = [
+// Shared by both allow-lists below, so neither has to be built by iterating
+// the other Set
+const RESUME_MIME_TYPES = [
   "application/pdf",
   "application/msword",
   "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
   "text/plain",
 ];
 
+/**
+ * Allowed file types for resumes
+ */
+export const ALLOWED_RESUME_TYPES: ReadonlySet<string> = new Set(RESUME_MIME_TYPES);
+
 /**
  * Allowed file types for general documents
  */
-export const ALLOWED_DOCUMENT_TYPES = [
-  ...ALLOWED_RESUME_TYPES,
-  "image/jpeg",
-  "image/png",
-  "image/gif",
-  "image/webp",
-];
+export const ALLOWED_DOCUMENT_TYPES: ReadonlySet<string> = new Set(
+  RESUME_MIME_TYPES.concat(["image/jpeg", "image/png", "image/gif", "image/webp"])
+);
 
 /**
  * Maximum file sizes (in MB)
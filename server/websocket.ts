@@ -1,5 +1,4 @@
-import { Server as HTTPServer } from "http";
-import { Server as SocketIOServer } from "socket.io";
+import type { Server as SocketIOServer } from "socket.io";
 
 interface UserPresence {
   userId: string;
@@ -11,14 +10,15 @@ interface UserPresence {
 
 const presenceMap = new Map<string, UserPresence[]>();
 
-export function initializeWebSocket(httpServer: HTTPServer) {
-  const io = new SocketIOServer(httpServer, {
-    cors: {
-      origin: "*",
-      methods: ["GET", "POST"],
-    },
-  });
-
+/**
+ * Attach presence tracking (who's viewing / typing) to the app's Socket.IO
+ * server. There is exactly one Socket.IO server per process, owned by the
+ * realtime notifications service; this module only adds handlers to it.
+ * Not registered yet: sockets are unauthenticated and every handler trusts
+ * the client-supplied userId, so authenticate the socket and take the user
+ * from the session before wiring this up.
+ */
+export function registerPresenceHandlers(io: SocketIOServer) {
   io.on("connection", (socket) => {
     console.log(`[WebSocket] Client connected: ${socket.id}`);
 
@@ -159,7 +159,7 @@ export function initializeWebSocket(httpServer: HTTPServer) {
   });
 
   // Cleanup stale presence every minute
-  setInterval(() => {
+  const cleanupTimer = setInterval(() => {
     const now = Date.now();
     presenceMap.forEach((presences, roomId) => {
       const updatedPresence = presences.filter(
@@ -173,8 +173,8 @@ export function initializeWebSocket(httpServer: HTTPServer) {
       }
     });
   }, 60000);
+  // Housekeeping only; never keep the process alive for it
+  cleanupTimer.unref();
 
-  console.log("[WebSocket] Server initialized");
-
-  return io;
+  console.log("[WebSocket] Presence tracking registered");
 }
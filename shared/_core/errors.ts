@@ -8,10 +8,12 @@ export class HttpError extends Error {
     message: string
   ) {
     super(message);
-    this.name = "HttpError";
   }
 }
 
+// Shared by every instance via the prototype instead of set per construction
+HttpError.prototype.name = "HttpError";
+
 // Convenience constructors
 export const BadRequestError = (msg: string) => new HttpError(400, msg);
 export const UnauthorizedError = (msg: string) => new HttpError(401, msg);